@@ -5,6 +5,7 @@ import asyncio
 from datetime import datetime, timedelta
 import json
 import os
+import glob
 from typing import Dict, Any, Optional, Set, Pattern
 import re
 import traceback
@@ -15,6 +16,9 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+EVENTS_DIR = 'data/events'
+LEGACY_EVENTS_FILE = 'data/events.json'
+
 class EventsCog(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
@@ -26,15 +30,37 @@ class EventsCog(commands.Cog):
         self.trigger_patterns: Dict[str, Dict[str, Dict[str, Any]]] = defaultdict(dict)
         self.trigger_cache: Dict[str, Pattern] = {}
         self.trigger_timeouts: Dict[str, float] = {}
+        self._dirty_guilds: Set[str] = set()
         self.load_data()
         self.cleanup_task = self.bot.loop.create_task(self.cleanup_old_events())
         self.reminder_task = self.bot.loop.create_task(self.check_event_reminders())
 
     def load_data(self):
         """Load event data and custom trigger patterns with enhanced error handling and validation"""
+        self.events = {}
+        self.event_messages = set()
+
+        # Older installs kept every guild in a single file; fold it into the shards
+        legacy_found = os.path.exists(LEGACY_EVENTS_FILE)
+        if legacy_found:
+            self._load_events_file(LEGACY_EVENTS_FILE)
+            self._dirty_guilds.update(event['guild_id'] for event in self.events.values())
+
+        for shard_path in glob.glob(os.path.join(EVENTS_DIR, '*.json')):
+            self._load_events_file(shard_path)
+
+        self.save_data()
+        if legacy_found and not self._dirty_guilds and os.path.exists(LEGACY_EVENTS_FILE):
+            try:
+                os.remove(LEGACY_EVENTS_FILE)
+            except OSError as e:
+                print(f"Error removing legacy events file: {e}")
+        self.load_triggers()
+
+    def _load_events_file(self, filepath: str):
+        """Load and validate events from a single data file into memory"""
         try:
-            # Load events data
-            with open('data/events.json', 'r') as f:
+            with open(filepath, 'r') as f:
                 data = json.load(f)
                 if not isinstance(data, dict):
                     raise ValueError("Invalid events data format")
@@ -42,7 +68,6 @@ class EventsCog(commands.Cog):
                 events_data = data.get('events', {})
                 message_ids = set(data.get('message_ids', []))
 
-                validated_events = {}
                 for event_id, event in events_data.items():
                     try:
                         if not all(key in event for key in ['guild_id', 'title', 'timestamp']):
@@ -52,38 +77,28 @@ class EventsCog(commands.Cog):
                         event_time = datetime.fromtimestamp(event['timestamp'])
                         if event_time < datetime.utcnow():
                             print(f"Skipping expired event {event_id}")
+                            self._dirty_guilds.add(event['guild_id'])
                             continue
 
                         event.setdefault('reactions', {})
                         event.setdefault('custom_emojis', self.default_reactions)
                         event.setdefault('creator_name', 'Unknown')
 
-                        validated_events[event_id] = event
+                        self.events[event_id] = event
 
                     except (ValueError, TypeError) as e:
                         print(f"Error validating event {event_id}: {e}")
                         continue
 
-                self.events = validated_events
-                self.event_messages = message_ids
+                self.event_messages.update(message_ids)
 
         except FileNotFoundError:
-            print("No existing events data found, creating new data structure")
-            self.events = {}
-            self.event_messages = set()
+            print(f"No existing events data found at {filepath}")
         except json.JSONDecodeError:
-            print("Error: events.json is corrupted, creating backup and new file")
-            self._backup_corrupted_file('data/events.json')
-            self.events = {}
-            self.event_messages = set()
-        except Exception as e:
-            print(f"Unexpected error loading events data: {e}")
-            traceback.print_exc()
-            self.events = {}
-            self.event_messages = set()
-
-        self.save_data()
-        self.load_triggers()
+            print(f"Error: {filepath} is corrupted, creating backup")
+            self._backup_corrupted_file(filepath)
+        except Exception:
+            logger.exception(f"Unexpected error loading events data from {filepath}")
 
     def load_triggers(self):
         """Load custom trigger patterns with enhanced validation and error handling"""
@@ -137,9 +152,8 @@ class EventsCog(commands.Cog):
         except json.JSONDecodeError as e:
             print(f"Error parsing custom triggers JSON: {e}")
             self._backup_corrupted_file('data/custom_triggers.json')
-        except Exception as e:
-            print(f"Error loading custom triggers: {e}")
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Error loading custom triggers")
 
     def _backup_corrupted_file(self, filepath: str):
         """Create a backup of a corrupted file"""
@@ -152,28 +166,49 @@ class EventsCog(commands.Cog):
             print(f"Error creating backup: {e}")
 
     def save_data(self):
-        """Save event data with atomic writes and validation"""
-        lock_key = "save_data"
-        temp_file = 'data/events_temp.json'
+        """Write the shard of every guild whose events changed since the last save"""
+        if not self._dirty_guilds:
+            return
+
+        dirty_guilds = self._dirty_guilds
+        self._dirty_guilds = set()
+
+        shards: Dict[str, Dict[str, Any]] = {guild_id: {} for guild_id in dirty_guilds}
+        for event_id, event in self.events.items():
+            shard = shards.get(event['guild_id'])
+            if shard is not None:
+                shard[event_id] = event
+
+        for guild_id, guild_events in shards.items():
+            shard_file = os.path.join(EVENTS_DIR, f'{guild_id}.json')
+            temp_file = f'{shard_file}.tmp'
+            try:
+                if not guild_events:
+                    if os.path.exists(shard_file):
+                        os.remove(shard_file)
+                    continue
 
-        try:
-            save_data = {
-                'events': self.events,
-                'message_ids': list(self.event_messages)
-            }
+                save_data = {
+                    'events': guild_events,
+                    'message_ids': [
+                        event['message_id'] for event in guild_events.values()
+                        if event.get('message_id') in self.event_messages
+                    ]
+                }
 
-            with open(temp_file, 'w') as f:
-                json.dump(save_data, f, indent=4)
+                with open(temp_file, 'w') as f:
+                    json.dump(save_data, f, indent=4)
 
-            os.replace(temp_file, 'data/events.json')
+                os.replace(temp_file, shard_file)
 
-        except Exception as e:
-            print(f"Error saving events data: {e}")
-            if os.path.exists(temp_file):
-                try:
-                    os.remove(temp_file)
-                except:
-                    pass
+            except Exception as e:
+                print(f"Error saving events data for guild {guild_id}: {e}")
+                self._dirty_guilds.add(guild_id)
+                if os.path.exists(temp_file):
+                    try:
+                        os.remove(temp_file)
+                    except:
+                        pass
 
     async def get_lock(self, key: str) -> asyncio.Lock:
         """Get or create a lock for the given key"""
@@ -335,6 +370,7 @@ class EventsCog(commands.Cog):
                     }
 
                     self.event_messages.add(event_message.id)
+                    self._dirty_guilds.add(str(interaction.guild.id))
                     self.save_data()
 
                     await interaction.followup.send("Event created successfully!", ephemeral=True)
@@ -466,11 +502,11 @@ class EventsCog(commands.Cog):
 
         except discord.NotFound:
             if event_id in self.events:
+                self._dirty_guilds.add(self.events[event_id]['guild_id'])
                 del self.events[event_id]
                 self.save_data()
-        except Exception as e:
-            print(f"Error updating event display: {e}")
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Error updating event display")
 
     @commands.Cog.listener()
     async def on_raw_reaction_add(self, payload: discord.RawReactionActionEvent):
@@ -485,6 +521,7 @@ class EventsCog(commands.Cog):
                 user = await self.bot.fetch_user(payload.user_id)
             except discord.NotFound:
                 self.event_messages.discard(payload.message_id)
+                self._dirty_guilds.add(str(payload.guild_id))
                 self.save_data()
                 return
             except Exception as e:
@@ -525,13 +562,13 @@ class EventsCog(commands.Cog):
 
                 if user.id not in self.events[event_id]["reactions"][emoji]:
                     self.events[event_id]["reactions"][emoji].append(user.id)
+                    self._dirty_guilds.add(self.events[event_id]['guild_id'])
                     self.save_data()
 
             await self.update_event_display(channel, message, event_id)
 
-        except Exception as e:
-            print(f"Error handling reaction add: {e}")
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Error handling reaction add")
 
     @commands.Cog.listener()
     async def on_raw_reaction_remove(self, payload: discord.RawReactionActionEvent):
@@ -546,6 +583,7 @@ class EventsCog(commands.Cog):
                 user = await self.bot.fetch_user(payload.user_id)
             except discord.NotFound:
                 self.event_messages.discard(payload.message_id)
+                self._dirty_guilds.add(str(payload.guild_id))
                 self.save_data()
                 return
             except Exception as e:
@@ -570,13 +608,13 @@ class EventsCog(commands.Cog):
                         uid for uid in self.events[event_id]["reactions"][emoji]
                         if uid != user.id
                     ]
+                    self._dirty_guilds.add(self.events[event_id]['guild_id'])
                     self.save_data()
 
             await self.update_event_display(channel, message, event_id)
 
-        except Exception as e:
-            print(f"Error handling reaction remove: {e}")
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Error handling reaction remove")
 
     def get_confirmed_participants(self, event_id: str) -> list:
         """Get list of users who reacted with anything except ❌ and ❔"""
@@ -624,15 +662,15 @@ class EventsCog(commands.Cog):
                     for event_id in events_to_remove:
                         if event_id in self.events:
                             msg_id = self.events[event_id]['message_id']
+                            self._dirty_guilds.add(self.events[event_id]['guild_id'])
                             del self.events[event_id]
                             self.event_messages.discard(msg_id)
 
                     self.save_data()
                     logger.info(f"Cleaned up {len(events_to_remove)} expired events")
 
-            except Exception as e:
-                logger.error(f"Error in cleanup task: {e}")
-                traceback.print_exc()
+            except Exception:
+                logger.exception("Error in cleanup task")
 
             await asyncio.sleep(300)  # Check every 5 minutes
 
@@ -651,9 +689,8 @@ class EventsCog(commands.Cog):
             self.trigger_cache.clear()
             self.trigger_timeouts.clear()
             logger.info("Successfully unloaded EventsCog and cleared resources")
-        except Exception as e:
-            logger.error(f"Error unloading EventsCog: {e}")
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Error unloading EventsCog")
 
     @app_commands.command(name="cancel")
     @app_commands.describe(event_id="The ID of the event to cancel")
@@ -692,13 +729,13 @@ class EventsCog(commands.Cog):
                 del self.events[event_id]
                 if event['message_id'] in self.event_messages:
                     self.event_messages.discard(event['message_id'])
+                self._dirty_guilds.add(event['guild_id'])
                 self.save_data()
 
             await interaction.response.send_message(f"Event '{event['title']}' has been cancelled.", ephemeral=True)
 
-        except Exception as e:
-            print(f"Error cancelling event: {e}")
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Error cancelling event")
             await interaction.response.send_message("An error occurred while cancelling the event.", ephemeral=True)
 
     @app_commands.command(name="events")
@@ -784,65 +821,50 @@ class EventsCog(commands.Cog):
 
             await interaction.response.defer(ephemeral=True)
 
-            try:
-                new_event_id = f"{interaction.guild_id}/{str(interaction.id)}"
-                embed = self.create_event_embed(
-                    original_event['title'],
-                    original_event['description'],
-                    event_time,
-                    original_event['custom_emojis']
-                )
-
-                event_message = await interaction.channel.send(embed=embed)
+            new_event_id = f"{interaction.guild_id}/{str(interaction.id)}"
+            embed = self.create_event_embed(
+                original_event['title'],
+                original_event['description'],
+                event_time,
+                original_event['custom_emojis']
+            )
 
-                for emoji in original_event['custom_emojis']:
-                    try:
-                        await event_message.add_reaction(emoji)
-                        await asyncio.sleep(0.5)
-                    except discord.HTTPException as e:
-                        print(f"Failed to add reaction {emoji}: {e}")
-                        continue
+            event_message = await interaction.channel.send(embed=embed)
 
-                self.events[new_event_id] = {
-                    "id": new_event_id,
-                    "guild_id": str(interaction.guild.id),
-                    "title": original_event['title'],
-                    "description": original_event['description'],
-                    "timestamp": int(event_time.timestamp()),
-                    "creator_id": interaction.user.id,
-                    "creator_name": interaction.user.name,
-                    "reactions": {},
-                    "custom_emojis": original_event['custom_emojis'],
-                    "message_id": event_message.id,
-                    "channel_id": interaction.channel_id,
-                    "created_at": datetime.utcnow().isoformat()
-                }
+            for emoji in original_event['custom_emojis']:
+                try:
+                    await event_message.add_reaction(emoji)
+                    await asyncio.sleep(0.5)
+                except discord.HTTPException as e:
+                    print(f"Failed to add reaction {emoji}: {e}")
+                    continue
 
-                self.event_messages.add(event_message.id)
-                self.save_data()
+            self.events[new_event_id] = {
+                "id": new_event_id,
+                "guild_id": str(interaction.guild.id),
+                "title": original_event['title'],
+                "description": original_event['description'],
+                "timestamp": int(event_time.timestamp()),
+                "creator_id": interaction.user.id,
+                "creator_name": interaction.user.name,
+                "reactions": {},
+                "custom_emojis": original_event['custom_emojis'],
+                "message_id": event_message.id,
+                "channel_id": interaction.channel_id,
+                "created_at": datetime.utcnow().isoformat()
+            }
 
-                await interaction.followup.send(
-                    f"Successfully duplicated event '{original_event['title']}' with new date/time.",
-                    ephemeral=True
-                )
+            self.event_messages.add(event_message.id)
+            self._dirty_guilds.add(str(interaction.guild.id))
+            self.save_data()
 
-            except Exception as e:
-                print(f"Error duplicating event: {e}")
-                traceback.print_exc()
-                if not interaction.response.is_done():
-                    await interaction.response.send_message(
-                        "A critical error occurred while duplicating the event.",
-                        ephemeral=True
-                    )
-                else:
-                    await interaction.followup.send(
-                        "A critical error occurred while duplicating the event.",
-                        ephemeral=True
-                    )
+            await interaction.followup.send(
+                f"Successfully duplicated event '{original_event['title']}' with new date/time.",
+                ephemeral=True
+            )
 
-        except Exception as e:
-            print(f"Error in duplicate_event: {e}")
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Error in duplicate_event")
             if not interaction.response.is_done():
                 await interaction.response.send_message(
                     "An error occurred while duplicating the event.",
@@ -876,9 +898,8 @@ class EventsCog(commands.Cog):
                             logger.error(f"Error sending reminder for event {event_id}: {e}")
                             continue
 
-            except Exception as e:
-                logger.error(f"Error in reminder task: {e}")
-                traceback.print_exc()
+            except Exception:
+                logger.exception("Error in reminder task")
 
             await asyncio.sleep(300)  # Check every 5 minutes
 
@@ -887,10 +908,9 @@ async def setup(bot: commands.Bot) -> None:
     """Initialize the events cog with improved error handling"""
     try:
         # Initialize required data files
-        if not os.path.exists('data'):
-            os.makedirs('data')
+        os.makedirs(EVENTS_DIR, exist_ok=True)
 
-        data_files = ['events.json', 'custom_triggers.json']
+        data_files = ['custom_triggers.json']
         for file in data_files:
             file_path = f'data/{file}'
             if not os.path.exists(file_path):
@@ -3,7 +3,15 @@ from discord import app_commands
 from discord.ext import commands
 import random
 import json
-from datetime import datetime, timedelta
+import os
+import glob
+import time
+from datetime import datetime, timedelta, timezone
+
+POLLS_DIR = 'data/polls'
+LEGACY_POLLS_FILE = 'data/polls.json'
+# Shard for polls created before polls recorded their guild
+UNSORTED_POLLS_SHARD = 'unsorted'
 
 class FunCog(commands.Cog):
     def __init__(self, bot):
@@ -12,6 +20,8 @@ class FunCog(commands.Cog):
         self.rep_cooldowns = {}
         self.rep_history = {}
         self.polls = {}
+        self._polls_by_guild = {}
+        self._dirty_guilds = set()
         self.load_data()
 
     def load_data(self):
@@ -20,19 +30,68 @@ class FunCog(commands.Cog):
                 data = json.load(f)
                 self.reputation = data.get('points', {})
                 self.rep_history = data.get('history', {})
-            with open('data/polls.json', 'r') as f:
-                self.polls = json.load(f)
         except FileNotFoundError:
             pass
 
+        os.makedirs(POLLS_DIR, exist_ok=True)
+        for shard_path in glob.glob(os.path.join(POLLS_DIR, '*.json')):
+            guild_key = os.path.splitext(os.path.basename(shard_path))[0]
+            with open(shard_path, 'r') as f:
+                self._polls_by_guild[guild_key] = json.load(f)
+
+        # Fold the old single-file poll store into per-guild shards
+        try:
+            with open(LEGACY_POLLS_FILE, 'r') as f:
+                legacy_polls = json.load(f)
+        except FileNotFoundError:
+            legacy_polls = {}
+        for poll_id, poll in legacy_polls.items():
+            guild_key = self.poll_shard(poll)
+            self._polls_by_guild.setdefault(guild_key, {})[poll_id] = poll
+            self._dirty_guilds.add(guild_key)
+
+        for guild_polls in self._polls_by_guild.values():
+            self.polls.update(guild_polls)
+
+        # Parse each poll's end time once so reaction handling can compare raw timestamps
+        for poll in self.polls.values():
+            if "end_time_ts" not in poll:
+                poll["end_time_ts"] = self.parse_end_time(poll["end_time"])
+
+        if legacy_polls:
+            self.save_data()
+            os.remove(LEGACY_POLLS_FILE)
+
     def save_data(self):
         with open('data/reputation.json', 'w') as f:
             json.dump({
                 'points': self.reputation,
                 'history': self.rep_history
             }, f, indent=4)
-        with open('data/polls.json', 'w') as f:
-            json.dump(self.polls, f, indent=4)
+
+        # Only rewrite the poll shards of guilds touched since the last save
+        for guild_key in self._dirty_guilds:
+            shard_path = os.path.join(POLLS_DIR, f'{guild_key}.json')
+            guild_polls = self._polls_by_guild.get(guild_key)
+            if guild_polls:
+                with open(shard_path, 'w') as f:
+                    json.dump(guild_polls, f, indent=4)
+            elif os.path.exists(shard_path):
+                os.remove(shard_path)
+        self._dirty_guilds.clear()
+
+    @staticmethod
+    def poll_shard(poll) -> str:
+        """Get the storage shard key for a poll"""
+        return str(poll.get("guild_id", UNSORTED_POLLS_SHARD))
+
+    @staticmethod
+    def parse_end_time(end_time: str) -> float:
+        """Convert a stored ISO end time to a UTC unix timestamp"""
+        parsed = datetime.fromisoformat(end_time)
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return parsed.timestamp()
 
     def get_level(self, points):
         """Calculate level based on reputation points"""
@@ -50,11 +109,12 @@ class FunCog(commands.Cog):
             return
 
         # Check cooldown
+        now = datetime.now(timezone.utc)
         cooldown_key = str(interaction.user.id)
         if cooldown_key in self.rep_cooldowns:
             last_use = datetime.fromisoformat(self.rep_cooldowns[cooldown_key])
-            if datetime.utcnow() - last_use < timedelta(hours=24):
-                remaining = timedelta(hours=24) - (datetime.utcnow() - last_use)
+            if now - last_use < timedelta(hours=24):
+                remaining = timedelta(hours=24) - (now - last_use)
                 await interaction.response.send_message(
                     f"You can give reputation again in {remaining.seconds // 3600} hours"
                 )
@@ -75,11 +135,11 @@ class FunCog(commands.Cog):
 
         self.rep_history[member_id].append({
             'from_user': interaction.user.id,
-            'timestamp': datetime.utcnow().isoformat(),
+            'timestamp': now.isoformat(),
             'points': 1
         })
 
-        self.rep_cooldowns[cooldown_key] = datetime.utcnow().isoformat()
+        self.rep_cooldowns[cooldown_key] = now.isoformat()
         self.save_data()
 
         # Create response embed
@@ -240,7 +300,7 @@ class FunCog(commands.Cog):
                 for t in duration.replace(" ", "").split(",")
                 if t[-1] in "smhd" and t[:-1].isdigit()
             )
-            end_time = datetime.utcnow() + timedelta(seconds=duration_seconds)
+            end_time = datetime.now(timezone.utc) + timedelta(seconds=duration_seconds)
         except (ValueError, KeyError):
             await interaction.response.send_message("Invalid duration format! Use format like 1h, 30m, 1d")
             return
@@ -279,16 +339,22 @@ class FunCog(commands.Cog):
             await poll_message.add_reaction(emojis[i])
 
         # Store enhanced poll data
-        self.polls[str(poll_message.id)] = {
+        poll_data = {
+            "guild_id": interaction.guild_id,
             "question": question,
             "options": options_list,
             "votes": {},
             "anonymous": anonymous,
             "multiple_choice": multiple_choice,
             "end_time": end_time.isoformat(),
+            "end_time_ts": end_time.timestamp(),
             "channel_id": poll_message.channel.id,
             "author_id": interaction.user.id
         }
+        guild_key = self.poll_shard(poll_data)
+        self.polls[str(poll_message.id)] = poll_data
+        self._polls_by_guild.setdefault(guild_key, {})[str(poll_message.id)] = poll_data
+        self._dirty_guilds.add(guild_key)
         self.save_data()
 
     @commands.Cog.listener()
@@ -301,7 +367,7 @@ class FunCog(commands.Cog):
             return
 
         poll = self.polls[poll_id]
-        if datetime.fromisoformat(poll["end_time"]) < datetime.utcnow():
+        if poll["end_time_ts"] < time.time():
             return
 
         emoji = str(payload.emoji)
@@ -326,6 +392,7 @@ class FunCog(commands.Cog):
         if user_id not in poll["votes"][str(option_idx)]:
             poll["votes"][str(option_idx)].append(user_id)
 
+        self._dirty_guilds.add(self.poll_shard(poll))
         self.save_data()
 
         # Update poll message
@@ -412,6 +479,9 @@ class FunCog(commands.Cog):
             pass
 
         del self.polls[message_id]
+        guild_key = self.poll_shard(poll)
+        self._polls_by_guild.get(guild_key, {}).pop(message_id, None)
+        self._dirty_guilds.add(guild_key)
         self.save_data()
 
         await interaction.response.send_message(embed=embed)
@@ -436,10 +506,9 @@ class FunCog(commands.Cog):
 
         for poll_id, poll in guild_polls:
             total_votes = sum(len(votes) for votes in poll["votes"].values())
-            end_time = datetime.fromisoformat(poll["end_time"])
-            time_left = end_time - datetime.utcnow()
+            end_ts = poll["end_time_ts"]
 
-            if time_left.total_seconds() > 0:
+            if end_ts > time.time():
                 status = "🟢 Active"
             else:
                 status = "🔴 Ended"
@@ -450,7 +519,7 @@ class FunCog(commands.Cog):
                       f"Total Votes: {total_votes}\n"
                       f"Options: {len(poll['options'])}\n"
                       f"Type: {'Anonymous' if poll['anonymous'] else 'Public'}\n"
-                      f"Ends: <t:{int(end_time.timestamp())}:R>",
+                      f"Ends: <t:{int(end_ts)}:R>",
                 inline=False
             )
 
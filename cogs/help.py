@@ -1,24 +1,82 @@
 import discord
 from discord import app_commands
 from discord.ext import commands
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from discord.ui import View, Button
 import math
+import operator
+import logging
 import asyncio
-from datetime import datetime, timedelta
+import time
+from collections import OrderedDict, defaultdict, namedtuple
+from types import MappingProxyType
+
+logger = logging.getLogger(__name__)
+
+COMMAND_CACHE_TTL = 60  # seconds before available commands and help embeds are rebuilt
+RATE_LIMIT_WINDOW = 2.0  # seconds between button presses per user
+RATE_LIMIT_CLEANUP_AGE = 300.0  # seconds before a rate limit entry is dropped
+RATE_LIMIT_CLEANUP_EVERY = 64  # checks between cleanup passes
+RATE_LIMIT_MAX_ENTRIES = 256  # users tracked per view before the oldest are evicted
+
+LOGSETTINGS_HELP = "\n".join([
+    "Configure server logging settings",
+    "\n**Parameters:**",
+    "• `retention_days`: How long to keep logs (1-90 days)",
+    "• `include_audit`: Enable/disable audit logs (true/false)",
+    "• `log_type`: Type of log to configure (message/member/server)",
+    "• `enabled`: Enable/disable the log type (true/false)",
+    "\n**Usage:**",
+    "• `/logsettings` - View current settings",
+    "• `/logsettings retention_days [1-90]`",
+    "• `/logsettings include_audit [true/false]`",
+    "• `/logsettings log_type [type] enabled [true/false]`",
+    "\n**Example:**",
+    "`/logsettings retention_days 30`"
+])
+
+CATEGORY_BUTTON_STYLES = {
+    "Fun": discord.ButtonStyle.success,
+    "Utility": discord.ButtonStyle.secondary,
+    "Moderation": discord.ButtonStyle.danger
+}
+
+# Everything the help menu needs to render one category, resolved once per cog
+CategoryRecord = namedtuple(
+    'CategoryRecord',
+    ['name', 'emoji', 'desc', 'overview_desc', 'required_perms', 'required_mask', 'button_label', 'button_style']
+)
 
 class HelpView(View):
-    def __init__(self, help_cog, timeout=180):
+    __slots__ = (
+        'help_cog', 'current_page', 'current_category', 'items_per_page', '_total_pages',
+        '_user', '_member_cache', '_lock', 'rate_limits', '_rate_limit_checks', '_message', '_last_state',
+        '_cat_buttons', '_prev', '_page_indicator', '_next', '_home'
+    )
+
+    def __init__(self, help_cog, user: discord.abc.User, timeout=180):
         super().__init__(timeout=timeout)
         self.help_cog = help_cog
+        self._user = user
+        self._member_cache: Dict[int, Optional[discord.Member]] = {}
         self.current_page = 0
         self.current_category = None
         self.items_per_page = 4
-        self.locks: Dict[str, asyncio.Lock] = {}
-        self.rate_limits: Dict[str, datetime] = {}
+        self._total_pages = math.ceil(len(self.help_cog.get_categories()) / self.items_per_page)
+        self._lock = asyncio.Lock()  # The view belongs to one user's help message, so one lock covers it
+        self.rate_limits: OrderedDict[str, float] = OrderedDict()
+        self._rate_limit_checks = 0
         self._message: Optional[discord.Message] = None  # Private message attribute
+        self._last_state = (self.current_category, self.current_page)  # What the message currently shows
+        self.build_buttons()
         self.setup_buttons()
 
+    def _member(self, guild: discord.Guild) -> Optional[discord.Member]:
+        """Resolve the view owner's member object for a guild once and reuse it"""
+        if guild.id not in self._member_cache:
+            self._member_cache[guild.id] = guild.get_member(self._user.id)
+        return self._member_cache[guild.id]
+
     @property
     def message(self) -> Optional[discord.Message]:
         """Safe access to message property"""
@@ -29,76 +87,94 @@ class HelpView(View):
         """Safe way to set message property"""
         self._message = value
 
+    def build_buttons(self):
+        """Create every button the view can show; setup_buttons only picks and updates them"""
+        self._cat_buttons: List[Button] = []
+        for record in self.help_cog.category_records:
+            button = Button(
+                label=record.button_label,
+                style=record.button_style,
+                custom_id=f"category_{record.name}",
+                row=0
+            )
+            button.callback = self.create_category_callback(record.name)
+            self._cat_buttons.append(button)
+
+        nav_row = 1
+        self._prev = Button(
+            label="◀️",
+            style=discord.ButtonStyle.secondary,
+            custom_id="prev_page",
+            row=nav_row
+        )
+        self._prev.callback = self.prev_page_callback
+
+        self._page_indicator = Button(
+            label=f"Page 1/{self._total_pages}",
+            style=discord.ButtonStyle.secondary,
+            disabled=True,
+            row=nav_row,
+            custom_id="page_indicator"
+        )
+
+        self._next = Button(
+            label="▶️",
+            style=discord.ButtonStyle.secondary,
+            custom_id="next_page",
+            row=nav_row
+        )
+        self._next.callback = self.next_page_callback
+
+        self._home = Button(
+            label="🏠 Back to Menu",
+            style=discord.ButtonStyle.danger,
+            custom_id="home",
+            row=2
+        )
+        self._home.callback = self.home_callback
+
     def setup_buttons(self):
-        """Dynamically create category buttons based on current page"""
+        """Show the category buttons for the current page and update navigation state"""
         try:
             self.clear_items()
 
-            categories = self.help_cog.get_categories()
-            total_pages = math.ceil(len(categories) / self.items_per_page)
             start_idx = self.current_page * self.items_per_page
             end_idx = start_idx + self.items_per_page
 
-            for category in categories[start_idx:end_idx]:
-                style = discord.ButtonStyle.primary
-                if category == "Fun":
-                    style = discord.ButtonStyle.success
-                elif category == "Utility":
-                    style = discord.ButtonStyle.secondary
-                elif category == "Moderation":
-                    style = discord.ButtonStyle.danger
-
-                button = Button(
-                    label=f"{self.help_cog.get_category_emoji(category)} {category}",
-                    style=style,
-                    custom_id=f"category_{category}",
-                    row=0
-                )
-                button.callback = self.create_category_callback(category)
+            for button in self._cat_buttons[start_idx:end_idx]:
                 self.add_item(button)
 
-            nav_row = 1
-            if total_pages > 1:
-                if self.current_page > 0:
-                    prev_button = Button(
-                        label="◀️",
-                        style=discord.ButtonStyle.secondary,
-                        custom_id="prev_page",
-                        row=nav_row
-                    )
-                    prev_button.callback = self.prev_page_callback
-                    self.add_item(prev_button)
-
-                page_indicator = Button(
-                    label=f"Page {self.current_page + 1}/{total_pages}",
-                    style=discord.ButtonStyle.secondary,
-                    disabled=True,
-                    row=nav_row,
-                    custom_id="page_indicator"
-                )
-                self.add_item(page_indicator)
-
-                if self.current_page < total_pages - 1:
-                    next_button = Button(
-                        label="▶️",
-                        style=discord.ButtonStyle.secondary,
-                        custom_id="next_page",
-                        row=nav_row
-                    )
-                    next_button.callback = self.next_page_callback
-                    self.add_item(next_button)
+            if self._total_pages > 1:
+                self._prev.disabled = self.current_page == 0
+                self.add_item(self._prev)
+
+                self._page_indicator.label = f"Page {self.current_page + 1}/{self._total_pages}"
+                self.add_item(self._page_indicator)
+
+                self._next.disabled = self.current_page >= self._total_pages - 1
+                self.add_item(self._next)
 
             if self.current_category:
-                home_button = Button(
-                    label="🏠 Back to Menu",
-                    style=discord.ButtonStyle.danger,
-                    custom_id="home",
-                    row=2
-                )
-                home_button.callback = self.home_callback
-                self.add_item(home_button)
-        except Exception as e:
-            print(f"Error in setup_buttons: {e}")
+                self.add_item(self._home)
+        except Exception:
+            logger.exception("Error in setup_buttons")
+
+    async def show_page(self, interaction: discord.Interaction, category: Optional[str]):
+        """Edit the help message to show a category's commands, or the overview when category is None"""
+        guild = interaction.guild
+        if not self.help_cog.is_embed_cached(guild.id, category):
+            # Rebuilding can walk the whole command tree, so acknowledge inside Discord's 3s window first
+            await interaction.response.defer()
+
+        if category is None:
+            embed = self.help_cog.get_categories_page(guild)
+        else:
+            embed = self.help_cog.get_commands_page(category, guild)
+
+        if interaction.response.is_done():
+            await interaction.edit_original_response(embed=embed, view=self)
+        else:
+            await interaction.response.edit_message(embed=embed, view=self)
 
     def create_category_callback(self, category: str):
         """Create category button callback"""
@@ -118,22 +194,27 @@ class HelpView(View):
                     )
                     return
 
-                if not await self.help_cog.can_access_category(interaction.user, category, interaction.guild):
+                if not await self.help_cog.can_access_category(
+                    interaction.user, category, interaction.guild, member=self._member(interaction.guild)
+                ):
                     await interaction.response.send_message(
                         "You don't have permission to view these commands.",
                         ephemeral=True
                     )
                     return
 
-                async with await self.get_lock(f"view_{interaction.guild.id}_{interaction.user.id}"):
+                async with self._lock:
+                    new_state = (category, self.current_page)
+                    if new_state == self._last_state:
+                        await interaction.response.defer()
+                        return
+
                     self.current_category = category
                     self.setup_buttons()
-                    await interaction.response.edit_message(
-                        embed=self.help_cog.get_commands_page(category, interaction.guild),
-                        view=self
-                    )
-            except Exception as e:
-                print(f"Error in category callback: {e}")
+                    await self.show_page(interaction, category)
+                    self._last_state = new_state
+            except Exception:
+                logger.exception("Error in category callback")
                 if not interaction.response.is_done():
                     await interaction.response.send_message(
                         "An error occurred while showing the commands.",
@@ -151,15 +232,20 @@ class HelpView(View):
                 )
                 return
 
-            async with await self.get_lock(f"view_{interaction.guild.id}_{interaction.user.id}"):
-                self.current_page = max(0, self.current_page - 1)
+            async with self._lock:
+                new_state = (None, max(0, self.current_page - 1))
+                if new_state == self._last_state:
+                    await interaction.response.defer()
+                    return
+
+                # Paging always renders the overview, so drop any category being shown
+                self.current_category = None
+                self.current_page = new_state[1]
                 self.setup_buttons()
-                await interaction.response.edit_message(
-                    embed=self.help_cog.get_categories_page(interaction.guild),
-                    view=self
-                )
-        except Exception as e:
-            print(f"Error in prev_page callback: {e}")
+                await self.show_page(interaction, None)
+                self._last_state = new_state
+        except Exception:
+            logger.exception("Error in prev_page callback")
             if not interaction.response.is_done():
                 await interaction.response.send_message(
                     "An error occurred while navigating pages.",
@@ -176,17 +262,20 @@ class HelpView(View):
                 )
                 return
 
-            async with await self.get_lock(f"view_{interaction.guild.id}_{interaction.user.id}"):
-                categories = self.help_cog.get_categories()
-                max_pages = math.ceil(len(categories) / self.items_per_page)
-                self.current_page = min(self.current_page + 1, max_pages - 1)
+            async with self._lock:
+                new_state = (None, min(self.current_page + 1, self._total_pages - 1))
+                if new_state == self._last_state:
+                    await interaction.response.defer()
+                    return
+
+                # Paging always renders the overview, so drop any category being shown
+                self.current_category = None
+                self.current_page = new_state[1]
                 self.setup_buttons()
-                await interaction.response.edit_message(
-                    embed=self.help_cog.get_categories_page(interaction.guild),
-                    view=self
-                )
-        except Exception as e:
-            print(f"Error in next_page callback: {e}")
+                await self.show_page(interaction, None)
+                self._last_state = new_state
+        except Exception:
+            logger.exception("Error in next_page callback")
             if not interaction.response.is_done():
                 await interaction.response.send_message(
                     "An error occurred while navigating pages.",
@@ -203,16 +292,19 @@ class HelpView(View):
                 )
                 return
 
-            async with await self.get_lock(f"view_{interaction.guild.id}_{interaction.user.id}"):
+            async with self._lock:
+                new_state = (None, 0)
+                if new_state == self._last_state:
+                    await interaction.response.defer()
+                    return
+
                 self.current_category = None
                 self.current_page = 0
                 self.setup_buttons()
-                await interaction.response.edit_message(
-                    embed=self.help_cog.get_categories_page(interaction.guild),
-                    view=self
-                )
-        except Exception as e:
-            print(f"Error in home callback: {e}")
+                await self.show_page(interaction, None)
+                self._last_state = new_state
+        except Exception:
+            logger.exception("Error in home callback")
             if not interaction.response.is_done():
                 await interaction.response.send_message(
                     "An error occurred while returning to the main menu.",
@@ -232,49 +324,45 @@ class HelpView(View):
                 try:
                     await self.message.edit(view=self)
                 except discord.NotFound:
-                    print("Message was deleted before timeout could be handled")
+                    logger.warning("Message was deleted before timeout could be handled")
                 except discord.Forbidden:
-                    print("Missing permissions to update timed out view")
+                    logger.warning("Missing permissions to update timed out view")
                 except discord.HTTPException as e:
-                    print(f"HTTP error updating timed out view: {e}")
-                except Exception as e:
-                    print(f"Unexpected error updating timed out view: {e}")
+                    logger.error("HTTP error updating timed out view: %s", e)
+                except Exception:
+                    logger.exception("Unexpected error updating timed out view")
 
             # Clear stored data
-            self.locks.clear()
             self.rate_limits.clear()
+            if self.help_cog._user_views.get(self._user.id) is self:
+                del self.help_cog._user_views[self._user.id]
 
-        except Exception as e:
-            print(f"Error handling view timeout: {e}")
-
-    async def get_lock(self, key: str) -> asyncio.Lock:
-        """Get or create a lock for a specific key"""
-        if key not in self.locks:
-            self.locks[key] = asyncio.Lock()
-        return self.locks[key]
+        except Exception:
+            logger.exception("Error handling view timeout")
 
     async def check_rate_limit(self, user_id: str) -> bool:
         """Enhanced rate limit checking with proper cleanup"""
         try:
-            now = datetime.utcnow()
+            now = time.monotonic()
 
-            # Cleanup old rate limits first
-            cleanup_threshold = now - timedelta(minutes=5)
-            self.rate_limits = {
-                uid: timestamp
-                for uid, timestamp in self.rate_limits.items()
-                if timestamp > cleanup_threshold
-            }
+            # Entries are kept oldest-first, so expired ones can be popped from the front
+            self._rate_limit_checks += 1
+            if self._rate_limit_checks % RATE_LIMIT_CLEANUP_EVERY == 0:
+                cleanup_threshold = now - RATE_LIMIT_CLEANUP_AGE
+                while self.rate_limits and next(iter(self.rate_limits.values())) <= cleanup_threshold:
+                    self.rate_limits.popitem(last=False)
 
-            if user_id in self.rate_limits:
-                if (now - self.rate_limits[user_id]) < timedelta(seconds=2):
-                    return False
+            if now - self.rate_limits.get(user_id, float('-inf')) < RATE_LIMIT_WINDOW:
+                return False
 
             self.rate_limits[user_id] = now
+            self.rate_limits.move_to_end(user_id)
+            while len(self.rate_limits) > RATE_LIMIT_MAX_ENTRIES:
+                self.rate_limits.popitem(last=False)
             return True
 
-        except Exception as e:
-            print(f"Error checking rate limit: {e}")
+        except Exception:
+            logger.exception("Error checking rate limit")
             return True  # Allow action on error to prevent lockout
 
 
@@ -315,108 +403,191 @@ class HelpCog(commands.Cog):
             "Reputation": ["manage_roles"],
             "Analytics": ["view_guild_insights"]
         }
+        # Permission bitmasks so access checks are a single integer comparison
+        self._category_required_masks = {
+            category: discord.Permissions(**{perm: True for perm in perms}).value
+            for category, perms in self.category_required_perms.items()
+        }
+        self._administrator_mask = discord.Permissions(administrator=True).value
+        self._categories_tuple = tuple(self.category_descriptions)
+        self._welcome_desc = (
+            "Welcome to the Bot Help Menu! Click a button below to view specific command categories.\n\n"
+            "**Required Bot Permissions**\n"
+            "• View Audit Log (For logging & moderation)\n"
+            "• Manage Messages & Roles\n"
+            "• Send Messages & Read History\n"
+            "• View Server Insights (For analytics)\n"
+            "• Manage Events (For event system)"
+        )
+        category_perm_suffix = {
+            category: f"\n*Requires: {', '.join(perm.replace('_', ' ').title() for perm in perms)}*"
+            for category, perms in self.category_required_perms.items()
+        }
+        self.category_records = tuple(
+            CategoryRecord(
+                name=category,
+                emoji=self.get_category_emoji(category),
+                desc=desc,
+                overview_desc=desc + category_perm_suffix.get(category, ""),
+                required_perms=tuple(self.category_required_perms.get(category, ())),
+                required_mask=self._category_required_masks.get(category, 0),
+                button_label=f"{self.get_category_emoji(category)} {category}",
+                button_style=CATEGORY_BUTTON_STYLES.get(category, discord.ButtonStyle.primary)
+            )
+            for category, desc in self.category_descriptions.items()
+        )
+        self._category_index = MappingProxyType({record.name: record for record in self.category_records})
+        self._no_access_embed = discord.Embed(
+            title="📌 Bot Help Menu",
+            description="There are no command categories available to you in this server.",
+            color=discord.Color.blue()
+        )
+        # Cog class name -> category, e.g. "AutoModCog" -> "AutoMod"
+        self._cog_to_category = {f"{category}Cog": category for category in self.category_descriptions}
+        # guild id -> (built at, category -> commands)
+        self._cmd_cache: Dict[int, Tuple[float, Dict[str, List[app_commands.Command]]]] = {}
+        self._user_views: Dict[int, HelpView] = {}  # Latest open help menu per user
+        # (guild id, category or None for the overview) -> (built at, embed)
+        self._embed_cache: Dict[Tuple[int, Optional[str]], Tuple[float, discord.Embed]] = {}
 
     def get_category_emoji(self, category: str) -> str:
         return self.category_emojis.get(category, "🔹")
 
-    def get_categories(self) -> List[str]:
+    def get_categories(self) -> Tuple[str, ...]:
         """Get all command categories"""
-        return list(self.category_descriptions.keys())
-
-    async def can_access_category(self, user: discord.Member, category: str, guild: discord.Guild) -> bool:
+        return self._categories_tuple
+
+    async def can_access_category(
+        self,
+        user: discord.Member,
+        category: str,
+        guild: discord.Guild,
+        member: Optional[discord.Member] = None
+    ) -> bool:
         """Check if a user has permission to access a category's commands"""
         try:
-            if category not in self.category_required_perms:
+            required_mask = self._category_required_masks.get(category)
+            if required_mask is None:
                 return True
 
             if not guild:
                 return False
 
-            member = guild.get_member(user.id)
+            if member is None:
+                member = guild.get_member(user.id)
             if not member:
                 return False
 
-            if member.guild_permissions.administrator:
+            user_perms = member.guild_permissions.value
+            if user_perms & self._administrator_mask:
                 return True
 
-            required_perms = self.category_required_perms[category]
-            user_perms = member.guild_permissions
-
-            return all(
-                getattr(user_perms, perm, False)
-                for perm in required_perms
-            )
-        except Exception as e:
-            print(f"Error checking permissions for {user.id} in {guild.id}: {e}")
+            return (user_perms & required_mask) == required_mask
+        except Exception:
+            logger.exception("Error checking permissions for %s in %s", user.id, guild.id)
             return False
 
+    def _bucket_commands_by_category(self, guild: discord.Guild) -> Dict[str, List[app_commands.Command]]:
+        """Group the guild's available commands by category in a single pass over the tree"""
+        now = time.monotonic()
+        cached = self._cmd_cache.get(guild.id)
+        if cached and now - cached[0] < COMMAND_CACHE_TTL:
+            return cached[1]
+
+        buckets: Dict[str, List[app_commands.Command]] = defaultdict(list)
+        for cmd in self.bot.tree.get_commands():
+            cog = cmd.binding if hasattr(cmd, 'binding') else None
+            if not cog:
+                continue
+            category = self._cog_to_category.get(cog.__class__.__name__)
+            if category is None:
+                continue
+            if hasattr(cmd, 'guild_ids') and cmd.guild_ids:
+                if guild.id not in cmd.guild_ids:
+                    continue
+            buckets[category].append(cmd)
+
+        for category_commands in buckets.values():
+            category_commands.sort(key=operator.attrgetter('name'))
+
+        self._cmd_cache[guild.id] = (now, buckets)
+        return buckets
+
+    async def _accessible_categories(self, user: discord.Member, guild: discord.Guild) -> List[str]:
+        """Get the categories with commands in this guild that the user is allowed to view"""
+        member = guild.get_member(user.id)
+        return [
+            category for category in self.get_categories()
+            if self.get_available_commands(category, guild)
+            and await self.can_access_category(user, category, guild, member=member)
+        ]
+
     def get_available_commands(self, category: str, guild: discord.Guild) -> List[app_commands.Command]:
         """Get all commands in a category that are available in the current guild"""
         try:
-            commands = []
-            for cmd in self.bot.tree.get_commands():
-                cog = cmd.binding if hasattr(cmd, 'binding') else None
-                if cog and cog.__class__.__name__.replace('Cog', '') == category:
-                    if hasattr(cmd, 'guild_ids') and cmd.guild_ids:
-                        if guild.id not in cmd.guild_ids:
-                            continue
-                    commands.append(cmd)
-            return commands
-        except Exception as e:
-            print(f"Error getting commands for category {category} in guild {guild.id}: {e}")
+            return self._bucket_commands_by_category(guild).get(category, [])
+        except Exception:
+            logger.exception("Error getting commands for category %s in guild %s", category, guild.id)
             return []
 
+    def _get_cached_embed(self, key: Tuple[int, Optional[str]], build) -> discord.Embed:
+        """Return a recently built help embed for key, rebuilding it once it expires"""
+        now = time.monotonic()
+        cached = self._embed_cache.get(key)
+        if cached and now - cached[0] < COMMAND_CACHE_TTL:
+            return cached[1]
+
+        embed = build()
+        self._embed_cache[key] = (now, embed)
+        return embed
+
+    def is_embed_cached(self, guild_id: int, category: Optional[str]) -> bool:
+        """Check whether a help embed can be served from the cache without rebuilding"""
+        cached = self._embed_cache.get((guild_id, category))
+        return cached is not None and time.monotonic() - cached[0] < COMMAND_CACHE_TTL
+
     def get_categories_page(self, guild: discord.Guild) -> discord.Embed:
         """Generate the embed for categories overview"""
         try:
-            embed = discord.Embed(
-                title="📌 Bot Help Menu",
-                color=discord.Color.blue(),
-                description=(
-                    "Welcome to the Bot Help Menu! Click a button below to view specific command categories.\n\n"
-                    "**Required Bot Permissions**\n"
-                    "• View Audit Log (For logging & moderation)\n"
-                    "• Manage Messages & Roles\n"
-                    "• Send Messages & Read History\n"
-                    "• View Server Insights (For analytics)\n"
-                    "• Manage Events (For event system)"
-                )
-            )
-
-            for category in self.get_categories():
-                emoji = self.get_category_emoji(category)
-                if self.get_available_commands(category, guild):
-                    desc = self.category_descriptions[category]
-
-                    # Add permission requirements if any
-                    if category in self.category_required_perms:
-                        required_perms = self.category_required_perms[category]
-                        formatted_perms = [perm.replace('_', ' ').title() for perm in required_perms]
-                        desc += f"\n*Requires: {', '.join(formatted_perms)}*"
-
-                    embed.add_field(
-                        name=f"{emoji} {category}",
-                        value=desc,
-                        inline=True
-                    )
-
-            embed.set_footer(text=f"Server: {guild.name} • Use the buttons below to navigate")
-            return embed
-        except Exception as e:
-            print(f"Error generating categories page for guild {guild.id}: {e}")
+            return self._get_cached_embed((guild.id, None), lambda: self._build_categories_page(guild))
+        except Exception:
+            logger.exception("Error generating categories page for guild %s", guild.id)
             return discord.Embed(
                 title="Error",
                 description="An error occurred while generating the help menu. Please try again.",
                 color=discord.Color.red()
             )
 
+    def _build_categories_page(self, guild: discord.Guild) -> discord.Embed:
+        """Build the categories overview embed"""
+        embed = discord.Embed(
+            title="📌 Bot Help Menu",
+            color=discord.Color.blue(),
+            description=self._welcome_desc
+        )
+
+        for record in self.category_records:
+            if self.get_available_commands(record.name, guild):
+                embed.add_field(
+                    name=record.button_label,
+                    value=record.overview_desc,
+                    inline=True
+                )
+
+        embed.set_footer(text=f"Server: {guild.name} • Use the buttons below to navigate")
+        return embed
+
     def get_commands_page(self, category: str, guild: discord.Guild) -> discord.Embed:
         """Generate the embed for a category's commands"""
-        emoji = self.get_category_emoji(category)
+        return self._get_cached_embed((guild.id, category), lambda: self._build_commands_page(category, guild))
+
+    def _build_commands_page(self, category: str, guild: discord.Guild) -> discord.Embed:
+        """Build the embed listing a category's commands"""
+        record = self._category_index[category]
         embed = discord.Embed(
-            title=f"{emoji} {category} Commands",
+            title=f"{record.emoji} {category} Commands",
             color=discord.Color.green(),
-            description=self.category_descriptions[category]
+            description=record.desc
         )
 
         commands = self.get_available_commands(category, guild)
@@ -428,29 +599,14 @@ class HelpCog(commands.Cog):
             )
             return embed
 
-        for cmd in sorted(commands, key=lambda x: x.name):
+        for cmd in commands:
             value = cmd.description or "No description available"
 
             # Only keep detailed parameters for logsettings
             if cmd.name == "logsettings":
-                full_desc = [
-                    "Configure server logging settings",
-                    "\n**Parameters:**",
-                    "• `retention_days`: How long to keep logs (1-90 days)",
-                    "• `include_audit`: Enable/disable audit logs (true/false)",
-                    "• `log_type`: Type of log to configure (message/member/server)",
-                    "• `enabled`: Enable/disable the log type (true/false)",
-                    "\n**Usage:**",
-                    "• `/logsettings` - View current settings",
-                    "• `/logsettings retention_days [1-90]`",
-                    "• `/logsettings include_audit [true/false]`",
-                    "• `/logsettings log_type [type] enabled [true/false]`",
-                    "\n**Example:**",
-                    "`/logsettings retention_days 30`"
-                ]
                 embed.add_field(
-                    name=f"/{cmd.name}",
-                    value="\n".join(full_desc),
+                    name="/logsettings",
+                    value=LOGSETTINGS_HELP,
                     inline=False
                 )
                 continue
@@ -500,7 +656,18 @@ class HelpCog(commands.Cog):
                 )
                 return
 
-            view = HelpView(self)
+            # Nothing to browse, so skip building the paginated view and its timeout
+            if not await self._accessible_categories(interaction.user, interaction.guild):
+                await interaction.response.send_message(embed=self._no_access_embed, ephemeral=True)
+                return
+
+            # A new menu supersedes the user's previous one; stop it so its timeout never fires
+            old_view = self._user_views.get(interaction.user.id)
+            if old_view is not None:
+                old_view.stop()
+
+            view = HelpView(self, interaction.user)
+            self._user_views[interaction.user.id] = view
             await interaction.response.send_message(
                 embed=self.get_categories_page(interaction.guild),
                 view=view,
@@ -512,20 +679,20 @@ class HelpCog(commands.Cog):
                 original_response = await interaction.original_response()
                 view.message = original_response
             except discord.NotFound:
-                print("Failed to store message reference - response not found")
+                logger.warning("Failed to store message reference - response not found")
             except discord.HTTPException as e:
-                print(f"HTTP error storing message reference: {e}")
-            except Exception as e:
-                print(f"Unexpected error storing message reference: {e}")
+                logger.error("HTTP error storing message reference: %s", e)
+            except Exception:
+                logger.exception("Unexpected error storing message reference")
 
         except discord.Forbidden as e:
-            print(f"Permission error showing help menu: {e}")
+            logger.error("Permission error showing help menu: %s", e)
             await interaction.response.send_message(
                 "I don't have permission to show the help menu. Please check my permissions.",
                 ephemeral=True
             )
-        except Exception as e:
-            print(f"Error showing help menu: {e}")
+        except Exception:
+            logger.exception("Error showing help menu")
             await interaction.response.send_message(
                 "An error occurred while showing the help menu. Please try again.",
                 ephemeral=True
@@ -534,6 +701,6 @@ class HelpCog(commands.Cog):
 async def setup(bot):
     try:
         await bot.add_cog(HelpCog(bot))
-        print("Successfully loaded HelpCog")
-    except Exception as e:
-        print(f"Error loading HelpCog: {str(e)}")
\ No newline at end of file
+        logger.info("Successfully loaded HelpCog")
+    except Exception:
+        logger.exception("Error loading HelpCog")
\ No newline at end of file
@@ -1,104 +1,211 @@
 import discord
 from discord import app_commands
 from discord.ext import commands, tasks
-import json
-from datetime import datetime, timedelta
-from typing import Optional, Dict, List, Union
+import asyncio
+import time
+from collections import OrderedDict
+import msgpack
+import orjson
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Dict, List, Tuple, Union
 import os
 
+LOG_CHANNELS_FILE = 'data/log_channels.mp'
+LOG_SETTINGS_FILE = 'data/log_settings.mp'
+LEGACY_LOG_CHANNELS_FILE = 'data/log_channels.json'  # Read once to migrate older installs
+LEGACY_LOG_SETTINGS_FILE = 'data/log_settings.json'
+AUDIT_CACHE_TTL = 10.0  # Seconds a fetched audit log page is reused
+AUDIT_FETCH_LIMIT = 5  # Entries fetched per audit log request
+AUDIT_CACHE_MAX_ENTRIES = 512  # (guild, action) pairs kept before evicting the oldest
+AUDIT_EVENT_SLACK = 2.0  # Seconds a cached audit entry may predate the event it is credited to
+COOLDOWN_MAX_ENTRIES = 4096  # Cooldown keys kept before stale ones are swept
+COOLDOWN_STALE_AGE = 300.0  # Seconds after which a cooldown entry is dropped by the sweep
+LOG_UPDATE_CONCURRENCY = 5  # Log message edits in flight per guild during update_logs
+ACTIVE_LOG_MAX_AGE = 3600.0  # Seconds a tracked log message keeps being refreshed
+
+DEFAULT_LOG_SETTINGS = {
+    "enabled_events": ["all"],
+    "retention_days": 30,
+    "include_audit": True,
+    "max_logs_per_channel": 5000
+}
+
+# Listener embed colours, built once instead of per event
+LOG_COLOR_RED = discord.Color.red()
+LOG_COLOR_GREEN = discord.Color.green()
+LOG_COLOR_BLUE = discord.Color.blue()
+LOG_COLOR_ORANGE = discord.Color.orange()
+
 class LoggingCog(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.log_channels: Dict[str, Dict[str, int]] = {}
-        self.log_settings: Dict[str, Dict[str, Union[List[str], int, bool]]] = {}
-        self.audit_cache: Dict[str, Dict] = {}
-        self.active_logs: Dict[str, Dict[int, Dict]] = {}
-        self.command_cooldowns: Dict[str, datetime] = {}
+        # Guild-keyed maps use the integer guild id in memory and on disk
+        self.log_channels: Dict[int, Dict[str, int]] = {}
+        self.log_settings: Dict[int, Dict[str, Union[List[str], int, bool]]] = {}
+        # Entries in both caches carry "timestamp" as a float unix epoch (time.time()), never an
+        # ISO string or datetime, so cleanup and update_logs compare it directly
+        self.audit_cache: Dict[int, Dict] = {}
+        self.active_logs: Dict[int, Dict[int, Dict]] = {}
+        self.command_cooldowns: Dict[Tuple[int, str], float] = {}  # (user id, command) -> time.monotonic() of last use
+        self._dirty = False  # Set by config mutators, written out by flush_data
+        self._audit_enabled: Dict[int, bool] = {}  # guild id -> include_audit, filled lazily
+        self._audit_lru: "OrderedDict[Tuple[int, int], Tuple[float, List[discord.AuditLogEntry]]]" = OrderedDict()
         self.load_data()
         print("LoggingCog initialized")
         self.update_logs.start()
         self.cleanup_old_logs.start()  # Start cleanup task
+        self.flush_data.start()
 
-    def cog_unload(self):
+    async def cog_unload(self):
         self.update_logs.cancel()
         self.cleanup_old_logs.cancel()
+        self.flush_data.cancel()
+        if self._dirty:
+            self._dirty = False
+            await self.save_data()
+
+    @tasks.loop(seconds=10)
+    async def flush_data(self):
+        """Write pending configuration changes in one batch"""
+        if self._dirty:
+            self._dirty = False
+            await self.save_data()
 
     @tasks.loop(hours=1)  # Run cleanup every hour
     async def cleanup_old_logs(self):
         """Cleanup old logs based on retention settings"""
         try:
-            now = datetime.utcnow()
+            now = datetime.now(timezone.utc)
             for guild_id, settings in self.log_settings.items():
                 retention_days = settings.get("retention_days", 30)
-                cutoff_date = now - timedelta(days=retention_days)
-
-                # Clean up active logs
-                if guild_id in self.active_logs:
-                    self.active_logs[guild_id] = {
-                        log_id: log_data
-                        for log_id, log_data in self.active_logs[guild_id].items()
-                        if datetime.fromisoformat(log_data["timestamp"]) > cutoff_date
-                    }
-
-                # Clean up audit cache
-                if guild_id in self.audit_cache:
-                    self.audit_cache[guild_id] = {
-                        event_id: event_data
-                        for event_id, event_data in self.audit_cache[guild_id].items()
-                        if datetime.fromisoformat(event_data["timestamp"]) > cutoff_date
-                    }
+                cutoff = (now - timedelta(days=retention_days)).timestamp()
+
+                # Clean up active logs and audit cache in place
+                for cache in (self.active_logs, self.audit_cache):
+                    entries = cache.get(guild_id)
+                    if not entries:
+                        continue
+                    expired = [key for key, data in entries.items() if data["timestamp"] <= cutoff]
+                    for key in expired:
+                        del entries[key]
 
             print(f"Log cleanup completed at {now.isoformat()}")
         except Exception as e:
             print(f"Error during log cleanup: {str(e)}")
 
+    @staticmethod
+    def _read_config(path: str, legacy_path: str):
+        """Read a msgpack config file, falling back to its legacy JSON file
+
+        Keys are normalised to int guild ids; JSON and older .mp files store them as strings.
+        """
+        try:
+            with open(path, 'rb') as f:
+                data, legacy = msgpack.unpackb(f.read(), raw=False, strict_map_key=False), False
+        except FileNotFoundError:
+            with open(legacy_path, 'rb') as f:
+                data, legacy = orjson.loads(f.read()), True
+        return {int(guild_id): value for guild_id, value in data.items()}, legacy
+
     def load_data(self):
         try:
             os.makedirs('data', exist_ok=True)
-            with open('data/log_channels.json', 'r') as f:
-                self.log_channels = json.load(f)
-            with open('data/log_settings.json', 'r') as f:
-                self.log_settings = json.load(f)
+            self.log_channels, channels_legacy = self._read_config(LOG_CHANNELS_FILE, LEGACY_LOG_CHANNELS_FILE)
+            self.log_settings, settings_legacy = self._read_config(LOG_SETTINGS_FILE, LEGACY_LOG_SETTINGS_FILE)
             print("Successfully loaded logging configuration")
+            if channels_legacy or settings_legacy:
+                self._save_sync()
         except FileNotFoundError:
             print("No existing logging configuration found, initializing empty")
             self.log_channels = {}
             self.log_settings = {}
-            self.save_data()
-        except json.JSONDecodeError as e:
+            self._save_sync()
+        except (ValueError, msgpack.UnpackException) as e:
             print(f"Error decoding logging configuration: {str(e)}")
             self.log_channels = {}
             self.log_settings = {}
-            self.save_data()
+            self._save_sync()
 
-    def save_data(self):
+    def _save_sync(self):
+        """Write both config files atomically via a temp file and os.replace"""
         try:
             os.makedirs('data', exist_ok=True)
-            with open('data/log_channels.json', 'w') as f:
-                json.dump(self.log_channels, f, indent=4)
-            with open('data/log_settings.json', 'w') as f:
-                json.dump(self.log_settings, f, indent=4)
+            for path, data in (
+                (LOG_CHANNELS_FILE, self.log_channels),
+                (LOG_SETTINGS_FILE, self.log_settings),
+            ):
+                with open(path + '.tmp', 'wb') as f:
+                    f.write(msgpack.packb(data, use_bin_type=True))
+                os.replace(path + '.tmp', path)
             print("Successfully saved logging configuration")
         except Exception as e:
             print(f"Error saving logging configuration: {str(e)}")
 
+    async def save_data(self):
+        await asyncio.to_thread(self._save_sync)
+
     async def ensure_guild_initialized(self, guild: discord.Guild) -> None:
         """Ensure guild data structures are initialized"""
-        guild_id = str(guild.id)
+        guild_id = guild.id
         if guild_id not in self.log_channels:
             self.log_channels[guild_id] = {}
         if guild_id not in self.log_settings:
-            self.log_settings[guild_id] = {
-                "enabled_events": ["all"],
-                "retention_days": 30,
-                "include_audit": True,
-                "max_logs_per_channel": 5000
-            }
+            self.log_settings[guild_id] = self._default_settings()
+
+    @staticmethod
+    def _default_settings() -> Dict[str, Union[List[str], int, bool]]:
+        """Fresh copy of the default settings with its own enabled_events list"""
+        return {**DEFAULT_LOG_SETTINGS, "enabled_events": list(DEFAULT_LOG_SETTINGS["enabled_events"])}
+
+    def _include_audit(self, guild_id: int) -> bool:
+        """Whether audit log lookups are enabled for a guild"""
+        enabled = self._audit_enabled.get(guild_id)
+        if enabled is None:
+            enabled = self.log_settings.get(guild_id, {}).get("include_audit", True)
+            self._audit_enabled[guild_id] = enabled
+        return enabled
+
+    async def _get_audit(
+        self, guild: discord.Guild, action: discord.AuditLogAction, target_id: int
+    ) -> Optional[discord.AuditLogEntry]:
+        """Newest audit entry for a target, reusing a recent fetch for the same action"""
+        key = (guild.id, action.value)
+        cached = self._audit_lru.get(key)
+        if cached and time.monotonic() - cached[0] < AUDIT_CACHE_TTL:
+            self._audit_lru.move_to_end(key)
+            entry = self._match_audit(cached[1], target_id)
+            # A cached entry older than this event belongs to an earlier action on the same target
+            cutoff = discord.utils.utcnow() - timedelta(seconds=AUDIT_EVENT_SLACK)
+            if entry and entry.created_at >= cutoff:
+                return entry
+
+        entries = [entry async for entry in guild.audit_logs(limit=AUDIT_FETCH_LIMIT, action=action)]
+        self._audit_lru[key] = (time.monotonic(), entries)
+        self._audit_lru.move_to_end(key)
+        if len(self._audit_lru) > AUDIT_CACHE_MAX_ENTRIES:
+            self._audit_lru.popitem(last=False)
+
+        return self._match_audit(entries, target_id)
+
+    @staticmethod
+    def _match_audit(entries: List[discord.AuditLogEntry], target_id: int) -> Optional[discord.AuditLogEntry]:
+        """Newest entry in a fetched page whose target is target_id"""
+        return next((entry for entry in entries if entry.target and entry.target.id == target_id), None)
+
+    @staticmethod
+    def _trunc(text: str, limit: int = 1024) -> str:
+        """Clip text to an embed field limit, marking the cut with an ellipsis"""
+        return text if len(text) <= limit else text[:limit - 3] + "..."
+
+    def _has_log_channel(self, guild: discord.Guild, log_type: str) -> bool:
+        """Cheap check for whether a log type has anywhere to go before building its embed"""
+        channels = self.log_channels.get(guild.id)
+        return bool(channels) and (log_type in channels or "all" in channels)
 
     async def get_log_channel(self, guild: discord.Guild, log_type: str = "all") -> Optional[discord.TextChannel]:
         """Get the appropriate logging channel based on log type"""
         try:
-            guild_id = str(guild.id)
+            guild_id = guild.id
             if guild_id not in self.log_channels:
                 return None
 
@@ -132,16 +239,17 @@ class LoggingCog(commands.Cog):
             if not embed.timestamp:
                 embed.timestamp = datetime.utcnow()
 
-            # Enforce size limits on embed fields
-            if len(embed.fields) > 25:  # Discord's limit
-                embed.fields = embed.fields[:25]
-
-            for field in embed.fields:
-                if len(field.value) > 1024:
-                    field.value = field.value[:1021] + "..."
+            # Enforce size limits on embed fields. embed.fields only returns
+            # read-only proxies, so the raw field dicts are trimmed instead
+            fields = getattr(embed, "_fields", None)
+            if fields:
+                del fields[25:]  # Discord's limit
+                if any(len(field["value"]) > 1024 for field in fields):
+                    embed._fields = [{**field, "value": self._trunc(field["value"])} for field in fields]
 
-            if embed.description and len(embed.description) > 4096:
-                embed.description = embed.description[:4093] + "..."
+            description = embed.description
+            if description and len(description) > 4096:
+                embed.description = description[:4093] + "..."
 
             message = await channel.send(embed=embed)
             print(f"Successfully logged {log_type} event in channel {channel.name}")
@@ -155,69 +263,63 @@ class LoggingCog(commands.Cog):
     @tasks.loop(seconds=30)
     async def update_logs(self):
         """Update active log messages periodically"""
-        current_time = datetime.utcnow()
-        for guild_id, logs in self.active_logs.copy().items():
-            for log_id, log_data in logs.copy().items():
+        now = time.time()
+        updates = []
+        for guild_id, logs in list(self.active_logs.items()):
+            semaphore = asyncio.Semaphore(LOG_UPDATE_CONCURRENCY)
+            for log_id, log_data in list(logs.items()):
                 try:
                     # Remove logs older than 1 hour
-                    if current_time - log_data["timestamp"] > timedelta(hours=1):
+                    if now - log_data["timestamp"] > ACTIVE_LOG_MAX_AGE:
                         del self.active_logs[guild_id][log_id]
                         if not self.active_logs[guild_id]:
                             del self.active_logs[guild_id]
                         continue
+                except Exception as e:
+                    print(f"Error updating log {log_id}: {e}")
+                    continue
 
-                    # Update the embed with latest information
-                    channel = self.bot.get_channel(log_data["channel_id"])
-                    if not channel:
-                        continue
+                updates.append(self._update_log(semaphore, guild_id, log_id, log_data))
 
-                    try:
-                        message = await channel.fetch_message(log_id)
-                        if not message:
-                            continue
-
-                        # Update based on log type
-                        if log_data["type"] == "mod":
-                            embed = await self.create_mod_log_embed(log_data["data"])
-                        elif log_data["type"] == "member":
-                            embed = await self.create_member_log_embed(log_data["data"])
-                        else:
-                            continue
-
-                        await message.edit(embed=embed)
-                    except discord.NotFound:
-                        # Message was deleted, remove from tracking
-                        del self.active_logs[guild_id][log_id]
+        await asyncio.gather(*updates, return_exceptions=True)
 
-                except Exception as e:
-                    print(f"Error updating log {log_id}: {e}")
+    async def _update_log(self, semaphore: asyncio.Semaphore, guild_id: int, log_id: int, log_data: Dict):
+        """Refresh a single tracked log message"""
+        async with semaphore:
+            try:
+                # Update the embed with latest information
+                channel = self.bot.get_channel(log_data["channel_id"])
+                if not channel:
+                    return
 
-    async def create_mod_log_embed(self, data: Dict) -> discord.Embed:
-        """Create or update a moderation log embed"""
-        embed = discord.Embed(
-            title=data["title"],
-            color=data["color"],
-            timestamp=datetime.fromisoformat(data["timestamp"])
-        )
+                try:
+                    message = await channel.fetch_message(log_id)
+                    if not message:
+                        return
 
-        for field in data["fields"]:
-            embed.add_field(
-                name=field["name"],
-                value=field["value"],
-                inline=field.get("inline", True)
-            )
+                    # Update based on log type
+                    if log_data["type"] not in ("mod", "member"):
+                        return
+                    embed = self._build_embed(log_data["data"])
 
-        if "footer" in data:
-            embed.set_footer(text=data["footer"])
+                    await message.edit(embed=embed)
+                except discord.NotFound:
+                    # Message was deleted, remove from tracking
+                    self.active_logs.get(guild_id, {}).pop(log_id, None)
 
-        return embed
+            except Exception as e:
+                print(f"Error updating log {log_id}: {e}")
+
+    def _build_embed(self, data: Dict) -> discord.Embed:
+        """Create or update a moderation or member log embed"""
+        timestamp = data.get("_ts_cached")
+        if timestamp is None:
+            timestamp = data["_ts_cached"] = datetime.fromtimestamp(data["timestamp"], tz=timezone.utc)
 
-    async def create_member_log_embed(self, data: Dict) -> discord.Embed:
-        """Create or update a member log embed"""
         embed = discord.Embed(
             title=data["title"],
             color=data["color"],
-            timestamp=datetime.fromisoformat(data["timestamp"])
+            timestamp=timestamp
         )
 
         for field in data["fields"]:
@@ -229,8 +331,11 @@ class LoggingCog(commands.Cog):
 
         if "thumbnail_url" in data:
             embed.set_thumbnail(url=data["thumbnail_url"])
+        if "footer" in data:
+            embed.set_footer(text=data["footer"])
 
         return embed
+
     @app_commands.command(name="setlog")
     @app_commands.default_permissions(manage_guild=True)
     async def setlog(
@@ -245,14 +350,14 @@ class LoggingCog(commands.Cog):
                 raise ValueError("This command can only be used in a server")
 
             await self.ensure_guild_initialized(interaction.guild)
-            guild_id = str(interaction.guild.id)
+            guild_id = interaction.guild.id
 
             # Verify bot permissions in the target channel
             if not channel.permissions_for(interaction.guild.me).send_messages:
                 raise discord.Forbidden("I need 'Send Messages' permission in the specified channel")
 
             self.log_channels[guild_id][log_type] = channel.id
-            self.save_data()
+            self._dirty = True
 
             # Send test log
             test_embed = discord.Embed(
@@ -314,16 +419,10 @@ class LoggingCog(commands.Cog):
             if not interaction.guild:
                 raise ValueError("This command can only be used in a server")
 
-            guild_id = str(interaction.guild.id)
-            if guild_id not in self.log_settings:
-                self.log_settings[guild_id] = {
-                    "enabled_events": ["all"],
-                    "retention_days": 30,
-                    "include_audit": True,
-                    "max_logs_per_channel": 5000
-                }
-
-            settings = self.log_settings[guild_id]
+            guild_id = interaction.guild.id
+            settings = self.log_settings.get(guild_id)
+            if settings is None:
+                settings = self.log_settings[guild_id] = self._default_settings()
 
             # Update settings based on parameters
             if retention_days is not None:
@@ -331,6 +430,7 @@ class LoggingCog(commands.Cog):
 
             if include_audit is not None:
                 settings["include_audit"] = include_audit
+                self._audit_enabled[interaction.guild.id] = include_audit
 
             if log_type and enabled is not None:
                 if enabled and log_type not in settings["enabled_events"]:
@@ -338,7 +438,7 @@ class LoggingCog(commands.Cog):
                 elif not enabled and log_type in settings["enabled_events"]:
                     settings["enabled_events"].remove(log_type)
 
-            self.save_data()
+            self._dirty = True
 
             # Create response embed
             embed = discord.Embed(
@@ -364,18 +464,19 @@ class LoggingCog(commands.Cog):
             enabled_events = settings["enabled_events"]
             embed.add_field(
                 name="Enabled Event Types",
-                value="\n".join(f"• {event}" for event in enabled_events) or "None",
+                value="\n".join([f"• {event}" for event in enabled_events]) or "None",
                 inline=False
             )
 
             # Show configured channels
             channels = self.log_channels.get(guild_id, {})
             if channels:
-                channel_text = "\n".join(
-                    f"{log_type}: {self.bot.get_channel(channel_id).mention}"
-                    for log_type, channel_id in channels.items()
-                    if self.bot.get_channel(channel_id)
-                )
+                channel_lines = []
+                for log_type, channel_id in channels.items():
+                    log_channel = self.bot.get_channel(channel_id)
+                    if log_channel:
+                        channel_lines.append(f"{log_type}: {log_channel.mention}")
+                channel_text = "\n".join(channel_lines) or "None"
                 embed.add_field(
                     name="Logging Channels",
                     value=channel_text,
@@ -394,43 +495,53 @@ class LoggingCog(commands.Cog):
 
     async def _check_cooldown(self, user_id: int, command: str, cooldown: int = 5) -> bool:
         """Check if a command is on cooldown"""
-        key = f"{user_id}_{command}"
-        if key in self.command_cooldowns:
-            if datetime.utcnow() - self.command_cooldowns[key] < timedelta(seconds=cooldown):
-                return False
-        self.command_cooldowns[key] = datetime.utcnow()
+        key = (user_id, command)
+        now = time.monotonic()
+        last_used = self.command_cooldowns.get(key)
+        if last_used is not None and now - last_used < cooldown:
+            return False
+        self.command_cooldowns[key] = now
+        if len(self.command_cooldowns) > COOLDOWN_MAX_ENTRIES:
+            self.command_cooldowns = {
+                k: v for k, v in self.command_cooldowns.items() if now - v < COOLDOWN_STALE_AGE
+            }
         return True
 
     @commands.Cog.listener()
     async def on_member_ban(self, guild: discord.Guild, user: discord.User):
+        if not self._has_log_channel(guild, "mod"):
+            return
+
         embed = discord.Embed(
             title="🔨 Member Banned",
             description=f"{user.mention} was banned from the server",
-            color=discord.Color.red(),
+            color=LOG_COLOR_RED,
             timestamp=datetime.utcnow()
         )
 
-        if self.log_settings.get(str(guild.id), {}).get("include_audit", True):
-            async for entry in guild.audit_logs(limit=1, action=discord.AuditLogAction.ban):
-                if entry.target.id == user.id:
+        if self._include_audit(guild.id):
+            entry = await self._get_audit(guild, discord.AuditLogAction.ban, user.id)
+            if entry:
+                embed.add_field(
+                    name="Banned By",
+                    value=entry.user.mention
+                )
+                if entry.reason:
                     embed.add_field(
-                        name="Banned By",
-                        value=entry.user.mention
+                        name="Reason",
+                        value=entry.reason
                     )
-                    if entry.reason:
-                        embed.add_field(
-                            name="Reason",
-                            value=entry.reason
-                        )
-                    break
 
         await self.log_event(guild, embed, "mod")
 
     @commands.Cog.listener()
     async def on_member_join(self, member: discord.Member):
+        if not self._has_log_channel(member.guild, "member"):
+            return
+
         embed = discord.Embed(
             title="👋 Member Joined",
-            color=discord.Color.green(),
+            color=LOG_COLOR_GREEN,
             timestamp=datetime.utcnow()
         )
 
@@ -448,9 +559,12 @@ class LoggingCog(commands.Cog):
 
     @commands.Cog.listener()
     async def on_member_remove(self, member: discord.Member):
+        if not self._has_log_channel(member.guild, "member"):
+            return
+
         embed = discord.Embed(
             title="👋 Member Left",
-            color=discord.Color.orange(),
+            color=LOG_COLOR_ORANGE,
             timestamp=datetime.utcnow()
         )
 
@@ -476,12 +590,12 @@ class LoggingCog(commands.Cog):
 
     @commands.Cog.listener()
     async def on_message_delete(self, message: discord.Message):
-        if message.author.bot:
+        if message.author.bot or not message.guild or not self._has_log_channel(message.guild, "msg"):
             return
 
         embed = discord.Embed(
             title="🗑️ Message Deleted",
-            color=discord.Color.red(),
+            color=LOG_COLOR_RED,
             timestamp=datetime.utcnow()
         )
 
@@ -495,18 +609,11 @@ class LoggingCog(commands.Cog):
         )
 
         if message.content:
-            if len(message.content) > 1024:
-                embed.add_field(
-                    name="Content",
-                    value=message.content[:1021] + "...",
-                    inline=False
-                )
-            else:
-                embed.add_field(
-                    name="Content",
-                    value=message.content,
-                    inline=False
-                )
+            embed.add_field(
+                name="Content",
+                value=self._trunc(message.content),
+                inline=False
+            )
 
         if message.attachments:
             attachment_list = "\n".join(
@@ -524,10 +631,12 @@ class LoggingCog(commands.Cog):
     async def on_message_edit(self, before: discord.Message, after: discord.Message):
         if before.author.bot or before.content == after.content:
             return
+        if not before.guild or not self._has_log_channel(before.guild, "msg"):
+            return
 
         embed = discord.Embed(
             title="✏️ Message Edited",
-            color=discord.Color.blue(),
+            color=LOG_COLOR_BLUE,
             timestamp=datetime.utcnow()
         )
 
@@ -544,39 +653,27 @@ class LoggingCog(commands.Cog):
             value=f"[Click Here]({after.jump_url})"
         )
 
-        if len(before.content) > 1024:
-            embed.add_field(
-                name="Before",
-                value=before.content[:1021] + "...",
-                inline=False
-            )
-        else:
-            embed.add_field(
-                name="Before",
-                value=before.content or "Empty",
-                inline=False
-            )
-
-        if len(after.content) > 1024:
-            embed.add_field(
-                name="After",
-                value=after.content[:1021] + "...",
-                inline=False
-            )
-        else:
-            embed.add_field(
-                name="After",
-                value=after.content or "Empty",
-                inline=False
-            )
+        embed.add_field(
+            name="Before",
+            value=self._trunc(before.content or "Empty"),
+            inline=False
+        )
+        embed.add_field(
+            name="After",
+            value=self._trunc(after.content or "Empty"),
+            inline=False
+        )
 
         await self.log_event(before.guild, embed, "msg")
 
     @commands.Cog.listener()
     async def on_guild_channel_create(self, channel: discord.abc.GuildChannel):
+        if not self._has_log_channel(channel.guild, "server"):
+            return
+
         embed = discord.Embed(
             title="📝 Channel Created",
-            color=discord.Color.green(),
+            color=LOG_COLOR_GREEN,
             timestamp=datetime.utcnow()
         )
 
@@ -595,22 +692,24 @@ class LoggingCog(commands.Cog):
                 value=channel.category.name if channel.category else "None"
             )
 
-        if self.log_settings.get(str(channel.guild.id), {}).get("include_audit", True):
-            async for entry in channel.guild.audit_logs(limit=1, action=discord.AuditLogAction.channel_create):
-                if entry.target.id == channel.id:
-                    embed.add_field(
-                        name="Created By",
-                        value=entry.user.mention
-                    )
-                    break
+        if self._include_audit(channel.guild.id):
+            entry = await self._get_audit(channel.guild, discord.AuditLogAction.channel_create, channel.id)
+            if entry:
+                embed.add_field(
+                    name="Created By",
+                    value=entry.user.mention
+                )
 
         await self.log_event(channel.guild, embed, "server")
 
     @commands.Cog.listener()
     async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel):
+        if not self._has_log_channel(channel.guild, "server"):
+            return
+
         embed = discord.Embed(
             title="🗑️ Channel Deleted",
-            color=discord.Color.red(),
+            color=LOG_COLOR_RED,
             timestamp=datetime.utcnow()
         )
 
@@ -623,20 +722,24 @@ class LoggingCog(commands.Cog):
             value=str(channel.type)
         )
 
-        if self.log_settings.get(str(channel.guild.id), {}).get("include_audit", True):
-            async for entry in channel.guild.audit_logs(limit=1, action=discord.AuditLogAction.channel_delete):
-                if entry.target.id == channel.id:
-                    embed.add_field(
-                        name="Deleted By",
-                        value=entry.user.mention
-                    )
-                    break
+        if self._include_audit(channel.guild.id):
+            entry = await self._get_audit(channel.guild, discord.AuditLogAction.channel_delete, channel.id)
+            if entry:
+                embed.add_field(
+                    name="Deleted By",
+                    value=entry.user.mention
+                )
 
         await self.log_event(channel.guild, embed, "server")
 
     @commands.Cog.listener()
     async def on_member_update(self, before: discord.Member, after: discord.Member):
-        if before.roles != after.roles:
+        if not self._has_log_channel(after.guild, "member"):
+            return
+
+        # _roles is discord.py's sorted SnowflakeList of role ids; comparing it avoids
+        # building Role lists for the many updates that don't touch roles
+        if before._roles != after._roles:
             # Role changes
             added_roles = set(after.roles) - set(before.roles)
             removed_roles = set(before.roles) - set(after.roles)
@@ -644,7 +747,7 @@ class LoggingCog(commands.Cog):
             if added_roles or removed_roles:
                 embed = discord.Embed(
                     title="👥 Member Roles Updated",
-                    color=discord.Color.blue(),
+                    color=LOG_COLOR_BLUE,
                     timestamp=datetime.utcnow()
                 )
 
@@ -667,14 +770,13 @@ class LoggingCog(commands.Cog):
                         inline=False
                     )
 
-                if self.log_settings.get(str(after.guild.id), {}).get("include_audit", True):
-                    async for entry in after.guild.audit_logs(limit=1, action=discord.AuditLogAction.member_role_update):
-                        if entry.target.id == after.id:
-                            embed.add_field(
-                                name="Updated By",
-                                value=entry.user.mention
-                            )
-                            break
+                if self._include_audit(after.guild.id):
+                    entry = await self._get_audit(after.guild, discord.AuditLogAction.member_role_update, after.id)
+                    if entry:
+                        embed.add_field(
+                            name="Updated By",
+                            value=entry.user.mention
+                        )
 
                 await self.log_event(after.guild, embed, "member")
 
@@ -682,7 +784,7 @@ class LoggingCog(commands.Cog):
         if before.nick != after.nick:
             embed = discord.Embed(
                 title="📝 Nickname Changed",
-                color=discord.Color.blue(),
+                color=LOG_COLOR_BLUE,
                 timestamp=datetime.utcnow()
             )
 
@@ -699,46 +801,44 @@ class LoggingCog(commands.Cog):
                 value=after.nick or "None"
             )
 
-            if self.log_settings.get(str(after.guild.id), {}).get("include_audit", True):
-                async for entry in after.guild.audit_logs(limit=1, action=discord.AuditLogAction.member_update):
-                    if entry.target.id == after.id:
-                        embed.add_field(
-                            name="Changed By",
-                            value=entry.user.mention
-                        )
-                        break
+            if self._include_audit(after.guild.id):
+                entry = await self._get_audit(after.guild, discord.AuditLogAction.member_update, after.id)
+                if entry:
+                    embed.add_field(
+                        name="Changed By",
+                        value=entry.user.mention
+                    )
 
             await self.log_event(after.guild, embed, "member")
 
     @commands.Cog.listener()
     async def on_member_kick(self, guild: discord.Guild, user: discord.User):
         """Event handler for member kicks"""
-        if not guild:
+        if not guild or not self._has_log_channel(guild, "mod"):
             return
 
         embed = discord.Embed(
             title="👢 Member Kicked",
             description=f"{user.mention} was kicked from the server",
-            color=discord.Color.orange(),
+            color=LOG_COLOR_ORANGE,
             timestamp=datetime.utcnow()
         )
 
-        if self.log_settings.get(str(guild.id), {}).get("include_audit", True):
+        if self._include_audit(guild.id):
             try:
-                async for entry in guild.audit_logs(limit=1, action=discord.AuditLogAction.kick):
-                    if entry.target.id == user.id:
+                entry = await self._get_audit(guild, discord.AuditLogAction.kick, user.id)
+                if entry:
+                    embed.add_field(
+                        name="Kicked By",
+                        value=entry.user.mention,
+                        inline=True
+                    )
+                    if entry.reason:
                         embed.add_field(
-                            name="Kicked By",
-                            value=entry.user.mention,
+                            name="Reason",
+                            value=entry.reason,
                             inline=True
                         )
-                        if entry.reason:
-                            embed.add_field(
-                                name="Reason",
-                                value=entry.reason,
-                                inline=True
-                            )
-                        break
             except discord.Forbidden:
                 embed.add_field(
                     name="Note",
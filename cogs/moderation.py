@@ -1,34 +1,104 @@
 import discord
 from discord import app_commands
 from discord.ext import commands, tasks
-import json
+import orjson
 import os
 import asyncio
-from datetime import datetime, timedelta
-from typing import Dict, Optional, Union, List, Any
+import bisect
+import sys
+import time
+import weakref
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from operator import itemgetter
+from typing import Dict, Optional, Union, List, Any, Tuple
 from utils.helpers import parse_time, format_duration
 
+MODERATION_STORES = {  # Write-ahead log store name -> (snapshot file, cog attribute)
+    "warnings": ("data/warnings.json", "warnings"),
+    "temp_roles": ("data/temp_roles.json", "temp_roles"),
+    "appeals": ("data/appeals.json", "appeals"),
+    "violations": ("data/violations.json", "violation_tracker"),
+}
+MODERATION_WAL_FILE = 'data/moderation.wal'  # Append-only JSONL of changes since the last snapshot
+WAL_COMPACT_MINUTES = 10  # How often the log is folded back into the snapshots
+INT_KEYED_STORES = {"warnings", "appeals", "violations"}  # Stores keyed by guild id, then user id
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS  # Int guild/user keys are written as JSON strings
+VIOLATION_WINDOW = 30 * 86400  # Seconds a violation counts towards the punishment tier
+BUTTON_COOLDOWN = 3.0  # Seconds between uses of the same moderation button by one moderator
+
+# (action, moderator id) -> time.monotonic() of last use, shared by every ModActionButtons view
+BUTTON_COOLDOWNS: Dict[Tuple[str, int], float] = {}
+
+# (action, target id) -> lock; entries vanish once no button callback holds or waits on them
+ACTION_LOCKS: "weakref.WeakValueDictionary[Tuple[str, int], asyncio.Lock]" = weakref.WeakValueDictionary()
+
+# Confirmation embeds for the moderation buttons; callbacks copy one and fill in the description
+BUTTON_EMBED_TEMPLATES = {
+    "warn": discord.Embed(title="Warning Issued", color=discord.Color.yellow()),
+    "timeout": discord.Embed(title="Member Timed Out", color=discord.Color.blue()),
+    "kick": discord.Embed(title="Member Kicked", color=discord.Color.red()),
+}
+
+# Static title and colour of the slash command embeds; commands copy one before adding fields
+COMMAND_EMBED_TEMPLATES = {
+    "warn": discord.Embed(title="⚠️ Warning Issued", color=discord.Color.yellow()),
+    "kick": discord.Embed(title="Member Kicked", color=discord.Color.red()),
+    "kick_log": discord.Embed(title="👢 Member Kicked", color=discord.Color.red()),
+    "moderate": discord.Embed(description="Select a moderation action:", color=discord.Color.blue()),
+}
+
 class ModActionButtons(discord.ui.View):
     def __init__(self, mod_cog, target: discord.Member):
         super().__init__(timeout=60)
         self.mod_cog = mod_cog
         self.target = target
-        self.locks: Dict[str, asyncio.Lock] = {}
-        self.cooldowns: Dict[str, datetime] = {}
-
-    async def get_lock(self, key: str) -> asyncio.Lock:
-        """Get or create a lock for the given key"""
-        if key not in self.locks:
-            self.locks[key] = asyncio.Lock()
-        return self.locks[key]
-
-    async def check_cooldown(self, key: str) -> bool:
-        """Check if an action is on cooldown"""
-        now = datetime.utcnow()
-        if key in self.cooldowns:
-            if now - self.cooldowns[key] < timedelta(seconds=3):
-                return False
-        self.cooldowns[key] = now
+
+    async def get_lock(self, action: str, target_id: int) -> asyncio.Lock:
+        """Get or create the lock serialising an action on a target across every open menu"""
+        key = (action, target_id)
+        lock = ACTION_LOCKS.get(key)
+        if lock is None:
+            lock = ACTION_LOCKS[key] = asyncio.Lock()
+        return lock
+
+    async def check_cooldown(self, action: str, user_id: int) -> bool:
+        """Check if an action is on cooldown for a moderator across every open menu"""
+        key = (action, user_id)
+        now = time.monotonic()
+        last_used = BUTTON_COOLDOWNS.get(key)
+        if last_used is not None and now - last_used < BUTTON_COOLDOWN:
+            return False
+        BUTTON_COOLDOWNS[key] = now
+        return True
+
+    async def _precheck(
+        self, interaction: discord.Interaction, action: str, permission: str, check_hierarchy: bool = True
+    ) -> bool:
+        """Run the cooldown, permission and role hierarchy checks shared by the buttons
+
+        Returns False after replying when the moderator is on cooldown; raises on any failed check.
+        """
+        if not await self.check_cooldown(action, interaction.user.id):
+            await interaction.response.send_message("Please wait before using this button again.", ephemeral=True)
+            return False
+
+        moderator = interaction.user
+        bot_member = interaction.guild.me
+        if not getattr(moderator.guild_permissions, permission):
+            raise discord.Forbidden(f"You don't have permission to {action} members")
+        if not getattr(bot_member.guild_permissions, permission):
+            raise discord.Forbidden(f"I don't have permission to {action} members")
+
+        if check_hierarchy:
+            target_top_role = self.target.top_role
+            if target_top_role >= bot_member.top_role:
+                raise ValueError(f"Cannot {action} a member with a higher role than me")
+            if target_top_role >= moderator.top_role:
+                raise ValueError(f"Cannot {action} a member with a higher role than you")
+            if self.target.guild_permissions.administrator:
+                raise ValueError(f"Cannot {action} an administrator")
+
         return True
 
     async def handle_button_error(self, interaction: discord.Interaction, error: Exception):
@@ -59,25 +129,14 @@ class ModActionButtons(discord.ui.View):
     @discord.ui.button(label="Warn", style=discord.ButtonStyle.secondary)
     async def warn_button(self, interaction: discord.Interaction, button: discord.ui.Button):
         try:
-            # Rate limit check
-            if not await self.check_cooldown(f"warn_{interaction.user.id}"):
-                await interaction.response.send_message("Please wait before using this button again.", ephemeral=True)
+            if not await self._precheck(interaction, "warn", "manage_messages", check_hierarchy=False):
                 return
 
-            if not interaction.user.guild_permissions.manage_messages:
-                raise discord.Forbidden("You don't have permission to warn members")
-
-            if not interaction.guild.me.guild_permissions.manage_messages:
-                raise discord.Forbidden("I don't have permission to warn members")
-
-            async with await self.get_lock(f"warn_{self.target.id}"):
+            async with await self.get_lock("warn", self.target.id):
                 await self.mod_cog.handle_violation(self.target, "Warning", severity=1)
 
-                embed = discord.Embed(
-                    title="Warning Issued",
-                    description=f"Warning issued to {self.target.mention}",
-                    color=discord.Color.yellow()
-                )
+                embed = BUTTON_EMBED_TEMPLATES["warn"].copy()
+                embed.description = f"Warning issued to {self.target.mention}"
                 await interaction.response.send_message(embed=embed, ephemeral=True)
 
         except Exception as e:
@@ -86,35 +145,15 @@ class ModActionButtons(discord.ui.View):
     @discord.ui.button(label="Timeout (30m)", style=discord.ButtonStyle.primary)
     async def timeout_button(self, interaction: discord.Interaction, button: discord.ui.Button):
         try:
-            # Rate limit check
-            if not await self.check_cooldown(f"timeout_{interaction.user.id}"):
-                await interaction.response.send_message("Please wait before using this button again.", ephemeral=True)
+            if not await self._precheck(interaction, "timeout", "moderate_members"):
                 return
 
-            if not interaction.user.guild_permissions.moderate_members:
-                raise discord.Forbidden("You don't have permission to timeout members")
-
-            if not interaction.guild.me.guild_permissions.moderate_members:
-                raise discord.Forbidden("I don't have permission to timeout members")
-
-            if self.target.top_role >= interaction.guild.me.top_role:
-                raise ValueError("Cannot timeout a member with a higher role than me")
-
-            if self.target.top_role >= interaction.user.top_role:
-                raise ValueError("Cannot timeout a member with a higher role than you")
-
-            if self.target.guild_permissions.administrator:
-                raise ValueError("Cannot timeout an administrator")
-
-            async with await self.get_lock(f"timeout_{self.target.id}"):
+            async with await self.get_lock("timeout", self.target.id):
                 duration = timedelta(minutes=30)
                 await self.target.timeout(duration, reason=f"Timeout via moderation button by {interaction.user}")
 
-                embed = discord.Embed(
-                    title="Member Timed Out",
-                    description=f"Timed out {self.target.mention} for 30 minutes",
-                    color=discord.Color.blue()
-                )
+                embed = BUTTON_EMBED_TEMPLATES["timeout"].copy()
+                embed.description = f"Timed out {self.target.mention} for 30 minutes"
                 await interaction.response.send_message(embed=embed, ephemeral=True)
 
         except Exception as e:
@@ -123,34 +162,14 @@ class ModActionButtons(discord.ui.View):
     @discord.ui.button(label="Kick", style=discord.ButtonStyle.danger)
     async def kick_button(self, interaction: discord.Interaction, button: discord.ui.Button):
         try:
-            # Rate limit check
-            if not await self.check_cooldown(f"kick_{interaction.user.id}"):
-                await interaction.response.send_message("Please wait before using this button again.", ephemeral=True)
+            if not await self._precheck(interaction, "kick", "kick_members"):
                 return
 
-            if not interaction.user.guild_permissions.kick_members:
-                raise discord.Forbidden("You don't have permission to kick members")
-
-            if not interaction.guild.me.guild_permissions.kick_members:
-                raise discord.Forbidden("I don't have permission to kick members")
-
-            if self.target.top_role >= interaction.guild.me.top_role:
-                raise ValueError("Cannot kick a member with a higher role than me")
-
-            if self.target.top_role >= interaction.user.top_role:
-                raise ValueError("Cannot kick a member with a higher role than you")
-
-            if self.target.guild_permissions.administrator:
-                raise ValueError("Cannot kick an administrator")
-
-            async with await self.get_lock(f"kick_{self.target.id}"):
+            async with await self.get_lock("kick", self.target.id):
                 await self.target.kick(reason=f"Kicked via moderation button by {interaction.user}")
 
-                embed = discord.Embed(
-                    title="Member Kicked",
-                    description=f"Kicked {self.target.mention}",
-                    color=discord.Color.red()
-                )
+                embed = BUTTON_EMBED_TEMPLATES["kick"].copy()
+                embed.description = f"Kicked {self.target.mention}"
                 await interaction.response.send_message(embed=embed, ephemeral=True)
 
         except Exception as e:
@@ -159,11 +178,12 @@ class ModActionButtons(discord.ui.View):
 class ModerationCog(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.warnings: Dict[str, Dict[str, List[Dict[str, Any]]]] = {} 
-        self.temp_roles: Dict[str, Dict[str, Any]] = {}
-        self.appeals: Dict[str, Dict[str, Any]] = {}
-        self.violation_tracker: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
-        self.command_cooldowns: Dict[str, datetime] = {}
+        # Guild and user ids are int keys in memory; orjson stringifies them on disk
+        self.warnings: Dict[int, Dict[int, List[Dict[str, Any]]]] = defaultdict(lambda: defaultdict(list))
+        self.temp_roles: Dict[str, Dict[str, Any]] = {}  # "<user id>" or "<user id>_<role id>" -> expiry
+        self.appeals: Dict[int, Dict[int, Any]] = {}
+        self.violation_tracker: Dict[int, Dict[int, List[Dict[str, Any]]]] = {}
+        self.command_cooldowns: Dict[Tuple[int, str], float] = {}  # (user id, command) -> time.monotonic() of last use
         self.punishment_tiers = {
             1: {"action": "warn", "duration": None},
             2: {"action": "timeout", "duration": timedelta(minutes=30)},
@@ -171,23 +191,40 @@ class ModerationCog(commands.Cog):
             4: {"action": "timeout", "duration": timedelta(days=1)},
             5: {"action": "ban", "duration": None}
         }
+        # Per-tier auto-moderation log embeds holding the fields that only depend on the tier
+        self._auto_mod_embeds: Dict[int, discord.Embed] = {}
+        self._tier_reason_suffix: Dict[int, str] = {}
+        for tier, punishment in self.punishment_tiers.items():
+            embed = discord.Embed(title="🛡️ Auto-Moderation Action", color=discord.Color.red())
+            embed.add_field(name="Action", value=punishment["action"].title())
+            if punishment["duration"]:
+                embed.add_field(name="Duration", value=str(punishment["duration"]))
+            embed.add_field(name="Tier", value=str(tier))
+            self._auto_mod_embeds[tier] = embed
+            self._tier_reason_suffix[tier] = f" (Violation tier {tier})"
         os.makedirs('data', exist_ok=True)
+        self._pending_writes: asyncio.Queue = asyncio.Queue()
+        self._wal_lock = asyncio.Lock()
+        self._snapshots = 0  # Bumped by every save_data so the writer can spot stale batches
         self.load_data()
+        self._wal_task = asyncio.create_task(self._wal_writer())
         self.check_temp_roles.start()
+        self.compact_data.start()
 
-    def cog_unload(self):
+    async def cog_unload(self):
         self.check_temp_roles.stop()
+        self.compact_data.cancel()
+        # save_data waits for any in-flight append before snapshotting, then the writer can go
+        await self.save_data()
+        self._wal_task.cancel()
 
     async def ensure_guild_initialized(self, guild: discord.Guild) -> None:
         """Ensure guild data structures are initialized"""
-        guild_id = str(guild.id)
-        if guild_id not in self.violation_tracker:
-            self.violation_tracker[guild_id] = {}
-        if guild_id not in self.warnings:
-            self.warnings[guild_id] = {}
-        if guild_id not in self.appeals:
-            self.appeals[guild_id] = {}
-        self.save_data()
+        guild_id = guild.id
+        # Warnings are a nested defaultdict and fill themselves in on first use
+        for store in (self.violation_tracker, self.appeals):
+            if guild_id not in store:
+                store[guild_id] = {}
 
     async def check_guild_permissions(self, interaction: discord.Interaction, action: str) -> bool:
         """Check if the bot has required permissions in the guild"""
@@ -241,58 +278,158 @@ class ModerationCog(commands.Cog):
             print(f"Error sending error message: {str(e)}")
 
     def load_data(self):
-        """Load moderation data from JSON files"""
+        """Load moderation snapshots and replay the write-ahead log on top of them"""
+        for store, (filename, attr) in MODERATION_STORES.items():
+            try:
+                with open(filename, 'rb') as f:
+                    data = orjson.loads(f.read())
+                if store in INT_KEYED_STORES:
+                    data = {
+                        int(guild_id): {int(user_id): value for user_id, value in users.items()}
+                        for guild_id, users in data.items()
+                    }
+                setattr(self, attr, data)
+            except FileNotFoundError:
+                setattr(self, attr, {})
+            except orjson.JSONDecodeError as e:
+                print(f"Error decoding {filename}: {str(e)}")
+                setattr(self, attr, {})
+
         try:
-            with open('data/warnings.json', 'r') as f:
-                self.warnings = json.load(f)
-            with open('data/temp_roles.json', 'r') as f:
-                self.temp_roles = json.load(f)
-            with open('data/appeals.json', 'r') as f:
-                self.appeals = json.load(f)
-            with open('data/violations.json', 'r') as f:
-                self.violation_tracker = json.load(f)
+            with open(MODERATION_WAL_FILE, 'rb') as f:
+                for line in f:
+                    try:
+                        self._apply_record(orjson.loads(line))
+                    except (orjson.JSONDecodeError, KeyError, TypeError) as e:
+                        # A torn final line from a crash mid-append is expected; skip it
+                        print(f"Skipping unreadable moderation log entry: {str(e)}")
         except FileNotFoundError:
-            # Create empty files if they don't exist
-            self.warnings = {}
-            self.temp_roles = {}
-            self.appeals = {}
-            self.violation_tracker = {}
-            self.save_data()
-        except json.JSONDecodeError as e:
-            print(f"Error decoding JSON data: {str(e)}")
-            # Initialize with empty data
-            self.warnings = {}
-            self.temp_roles = {}
-            self.appeals = {}
-            self.violation_tracker = {}
-            self.save_data()
-
-    def save_data(self):
-        """Save moderation data to JSON files"""
-        try:
-            os.makedirs('data', exist_ok=True)
-            for filename, data in [
-                ('warnings.json', self.warnings),
-                ('temp_roles.json', self.temp_roles),
-                ('appeals.json', self.appeals),
-                ('violations.json', self.violation_tracker)
-            ]:
-                with open(f'data/{filename}', 'w') as f:
-                    json.dump(data, f, indent=4)
-        except Exception as e:
-            print(f"Error saving data: {str(e)}")
+            pass
+
+        # Any guild or user can be warned with a single append
+        self.warnings = defaultdict(
+            lambda: defaultdict(list),
+            {guild_id: defaultdict(list, users) for guild_id, users in self.warnings.items()}
+        )
+
+        # Older data stored ISO strings; violation timestamps and expiries are now unix epoch ints
+        # Violation types and temp actions come from a small fixed set, so share one string each
+        for users in self.violation_tracker.values():
+            for user_violations in users.values():
+                for v in user_violations:
+                    v["timestamp"] = self._to_epoch(v["timestamp"])
+                    v["type"] = sys.intern(v["type"])
+        for data in self.temp_roles.values():
+            data["expires"] = self._to_epoch(data["expires"])
+            data["action"] = sys.intern(data["action"])
+
+    @staticmethod
+    def _to_epoch(value: Union[int, float, str]) -> int:
+        """Convert a stored timestamp (epoch or naive-UTC ISO string) to unix epoch seconds"""
+        if isinstance(value, (int, float)):
+            return int(value)
+        parsed = datetime.fromisoformat(value)
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return int(parsed.timestamp())
+
+    def _apply_record(self, record: Dict[str, Any]):
+        """Replay one write-ahead log entry onto the in-memory stores"""
+        store = record["store"]
+        data = getattr(self, MODERATION_STORES[store][1])
+        path = record["path"]
+        if store in INT_KEYED_STORES:
+            path = [int(key) for key in path]
+        *parents, last = path
+        for key in parents:
+            data = data.setdefault(key, {})
+        if record.get("delete"):
+            data.pop(last, None)
+        else:
+            data[last] = record["value"]
+
+    def _record(self, store: str, *path):
+        """Queue a write-ahead log entry holding the current value at path in a store
+
+        Entries overwrite (or delete) the whole value at path, so replaying one twice is harmless.
+        """
+        data = getattr(self, MODERATION_STORES[store][1])
+        for key in path[:-1]:
+            data = data.get(key, {})
+        if path[-1] in data:
+            record = {"store": store, "path": path, "value": data[path[-1]]}
+        else:
+            record = {"store": store, "path": path, "delete": True}
+        self._pending_writes.put_nowait(orjson.dumps(record, option=ORJSON_OPTIONS | orjson.OPT_APPEND_NEWLINE))
+
+    @staticmethod
+    def _append_wal(lines: bytes):
+        with open(MODERATION_WAL_FILE, 'ab') as f:
+            f.write(lines)
+
+    async def _wal_writer(self):
+        """Append queued log entries, batching everything queued since the last write"""
+        while True:
+            lines = [await self._pending_writes.get()]
+            snapshots = self._snapshots
+            async with self._wal_lock:
+                if snapshots != self._snapshots:
+                    # A snapshot taken meanwhile already holds this entry and may hold newer ones
+                    lines.clear()
+                while not self._pending_writes.empty():
+                    lines.append(self._pending_writes.get_nowait())
+                if not lines:
+                    continue
+                try:
+                    await asyncio.to_thread(self._append_wal, b"".join(lines))
+                except Exception as e:
+                    print(f"Error writing moderation log: {str(e)}")
+
+    def _snapshot_payloads(self) -> List[tuple]:
+        """Serialise every store on the calling thread so the snapshot is consistent"""
+        return [
+            (filename, orjson.dumps(getattr(self, attr), option=ORJSON_OPTIONS))
+            for filename, attr in MODERATION_STORES.values()
+        ]
+
+    @staticmethod
+    def _write_snapshots(payloads: List[tuple]):
+        """Atomically replace each snapshot file, then truncate the write-ahead log"""
+        os.makedirs('data', exist_ok=True)
+        for filename, payload in payloads:
+            with open(filename + '.tmp', 'wb') as f:
+                f.write(payload)
+            os.replace(filename + '.tmp', filename)
+        open(MODERATION_WAL_FILE, 'w').close()
+
+    async def save_data(self):
+        """Compact the write-ahead log into fresh snapshot files"""
+        async with self._wal_lock:
+            payloads = self._snapshot_payloads()
+            self._snapshots += 1
+            # Everything still queued is already reflected in the snapshot
+            while not self._pending_writes.empty():
+                self._pending_writes.get_nowait()
+            try:
+                await asyncio.to_thread(self._write_snapshots, payloads)
+            except Exception as e:
+                print(f"Error saving data: {str(e)}")
+
+    @tasks.loop(minutes=WAL_COMPACT_MINUTES)
+    async def compact_data(self):
+        await self.save_data()
 
     async def initialize_guild(self, guild: discord.Guild):
         """Initialize moderation data for a new guild"""
-        guild_id = str(guild.id)
-        # Initialize all necessary dictionaries for the guild
-        if guild_id not in self.violation_tracker:
-            self.violation_tracker[guild_id] = {}
-        if guild_id not in self.warnings:
-            self.warnings[guild_id] = {}
-        if guild_id not in self.appeals:
-            self.appeals[guild_id] = {}
-        self.save_data()
+        await self.ensure_guild_initialized(guild)
+
+    @staticmethod
+    def _trim_violations(user_violations: List[Dict[str, Any]], now: int) -> bool:
+        """Drop violations older than the window from a chronological list; True if any went"""
+        start = bisect.bisect_left(user_violations, now - VIOLATION_WINDOW, key=itemgetter("timestamp"))
+        if start:
+            del user_violations[:start]
+        return bool(start)
 
     async def handle_violation(self, member: discord.Member, violation_type: str, severity: int = 1):
         """Handle a rule violation with automatic punishment escalation"""
@@ -303,49 +440,43 @@ class ModerationCog(commands.Cog):
             if not member.guild.me.guild_permissions.manage_roles:
                 raise discord.Forbidden("Bot lacks required permissions")
 
-            guild_id = str(member.guild.id)
-            user_id = str(member.id)
+            guild_id = member.guild.id
+            user_id = member.id
 
             await self.ensure_guild_initialized(member.guild)
 
-            if guild_id not in self.violation_tracker:
-                self.violation_tracker[guild_id] = {}
-            if user_id not in self.violation_tracker[guild_id]:
-                self.violation_tracker[guild_id][user_id] = []
+            user_violations = self.violation_tracker.setdefault(guild_id, {}).setdefault(user_id, [])
 
             # Add new violation with additional validation
             if not isinstance(severity, int) or severity < 1 or severity > 5:
                 severity = 1  # Default to lowest severity if invalid
 
-            self.violation_tracker[guild_id][user_id].append({
+            now = int(time.time())
+            violation_type = sys.intern(violation_type)
+            user_violations.append({
                 "type": violation_type,
                 "severity": severity,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": now
             })
 
-            # Calculate tier based on recent violations
-            recent_violations = [
-                v for v in self.violation_tracker[guild_id][user_id]
-                if datetime.utcnow() - datetime.fromisoformat(v["timestamp"]) < timedelta(days=30)
-            ]
+            # Drop violations outside the window so the list stays bounded, then tier on what's left
+            self._trim_violations(user_violations, now)
+            recent_violations = user_violations
 
             tier = min(5, len(recent_violations))  # Cap at tier 5
             punishment = self.punishment_tiers[tier]
 
-            reason = f"Auto-escalation: {violation_type} (Violation tier {tier})"
+            reason = "Auto-escalation: " + violation_type + self._tier_reason_suffix[tier]
 
             # Execute punishment with enhanced error handling
             try:
                 if punishment["action"] == "warn":
-                    if guild_id not in self.warnings:
-                        self.warnings[guild_id] = {}
-                    if user_id not in self.warnings[guild_id]:
-                        self.warnings[guild_id][user_id] = []
                     self.warnings[guild_id][user_id].append({
                         "reason": reason,
                         "moderator": self.bot.user.id,
                         "timestamp": datetime.utcnow().isoformat()
                     })
+                    self._record("warnings", guild_id, user_id)
 
                 elif punishment["action"] == "timeout":
                     if not member.guild.me.guild_permissions.moderate_members:
@@ -357,7 +488,7 @@ class ModerationCog(commands.Cog):
                         raise discord.Forbidden("Bot lacks ban permissions")
                     await member.ban(reason=reason)
 
-                self.save_data()
+                self._record("violations", guild_id, user_id)
 
                 # Update reputation if available
                 reputation_cog = self.bot.get_cog("ReputationCog")
@@ -371,17 +502,12 @@ class ModerationCog(commands.Cog):
                 try:
                     log_cog = self.bot.get_cog("LoggingCog")
                     if log_cog:
-                        embed = discord.Embed(
-                            title="🛡️ Auto-Moderation Action",
-                            description=f"Action taken against {member.mention}",
-                            color=discord.Color.red(),
-                            timestamp=datetime.utcnow()
-                        )
-                        embed.add_field(name="Violation", value=violation_type)
-                        embed.add_field(name="Action", value=punishment["action"].title())
-                        if punishment["duration"]:
-                            embed.add_field(name="Duration", value=str(punishment["duration"]))
-                        embed.add_field(name="Tier", value=str(tier))
+                        embed = self._auto_mod_embeds[tier].copy()
+                        # Embed.copy() shares the field list, so detach it before adding fields
+                        embed._fields = embed._fields.copy()
+                        embed.description = f"Action taken against {member.mention}"
+                        embed.timestamp = datetime.utcnow()
+                        embed.insert_field_at(0, name="Violation", value=violation_type)
                         embed.add_field(name="Total Recent Violations", value=str(len(recent_violations)))
                         embed.set_footer(text=f"User ID: {member.id}")
 
@@ -409,22 +535,20 @@ class ModerationCog(commands.Cog):
     @app_commands.default_permissions(manage_messages=True)
     async def violations(self, interaction: discord.Interaction, member: discord.Member):
         """View a member's violation history"""
-        guild_id = str(interaction.guild.id)
-        user_id = str(member.id)
+        guild_id = interaction.guild.id
+        user_id = member.id
 
         await self.ensure_guild_initialized(interaction.guild)
 
-        if (guild_id not in self.violation_tracker or 
-            user_id not in self.violation_tracker[guild_id] or 
-            not self.violation_tracker[guild_id][user_id]):
+        violations = self.violation_tracker.get(guild_id, {}).get(user_id)
+        if not violations:
             await interaction.response.send_message(f"{member.mention} has no violations.")
             return
 
-        violations = self.violation_tracker[guild_id][user_id]
-        recent_violations = [
-            v for v in violations
-            if datetime.utcnow() - datetime.fromisoformat(v["timestamp"]) < timedelta(days=30)
-        ]
+        # The stored list is the recent window; only entries that aged out since the last write go
+        if self._trim_violations(violations, int(time.time())):
+            self._record("violations", guild_id, user_id)
+        recent_violations = violations
 
         embed = discord.Embed(
             title=f"Violation History for {member.name}",
@@ -432,12 +556,11 @@ class ModerationCog(commands.Cog):
         )
 
         for i, v in enumerate(recent_violations, 1):
-            timestamp = datetime.fromisoformat(v["timestamp"])
             embed.add_field(
                 name=f"Violation #{i}",
                 value=f"Type: {v['type']}\n"
                       f"Severity: {v['severity']}\n"
-                      f"When: <t:{int(timestamp.timestamp())}:R>",
+                      f"When: <t:{v['timestamp']}:R>",
                 inline=False
             )
 
@@ -451,14 +574,15 @@ class ModerationCog(commands.Cog):
     @app_commands.default_permissions(administrator=True)
     async def clearviolations(self, interaction: discord.Interaction, member: discord.Member):
         """Clear a member's violation history"""
-        guild_id = str(interaction.guild.id)
-        user_id = str(member.id)
+        guild_id = interaction.guild.id
+        user_id = member.id
 
         await self.ensure_guild_initialized(interaction.guild)
 
-        if guild_id in self.violation_tracker and user_id in self.violation_tracker[guild_id]:
-            del self.violation_tracker[guild_id][user_id]
-            self.save_data()
+        guild_violations = self.violation_tracker.get(guild_id, {})
+        if user_id in guild_violations:
+            del guild_violations[user_id]
+            self._record("violations", guild_id, user_id)
             await interaction.response.send_message(f"Cleared violation history for {member.mention}")
         else:
             await interaction.response.send_message(f"{member.mention} has no violations to clear.")
@@ -483,14 +607,14 @@ class ModerationCog(commands.Cog):
             if duration:
                 try:
                     ban_duration = parse_time(duration)
-                    unban_time = datetime.utcnow() + ban_duration
+                    unban_time = int(time.time() + ban_duration.total_seconds())
                     self.temp_roles[str(member.id)] = {
                         "action": "ban",
                         "guild_id": interaction.guild.id,
-                        "expires": unban_time.isoformat(),
+                        "expires": unban_time,
                         "reason": reason
                     }
-                    self.save_data()
+                    self._record("temp_roles", str(member.id))
                     await interaction.response.send_message(
                         f"Banned {member.mention} for {format_duration(ban_duration)}. Reason: {reason}"
                     )
@@ -523,15 +647,16 @@ class ModerationCog(commands.Cog):
                 raise ValueError("You cannot assign this role!")
 
             await member.add_roles(role)
-            expire_time = datetime.utcnow() + role_duration
+            expire_time = int(time.time() + role_duration.total_seconds())
 
-            self.temp_roles[f"{member.id}_{role.id}"] = {
+            temp_key = f"{member.id}_{role.id}"
+            self.temp_roles[temp_key] = {
                 "action": "role",
                 "guild_id": interaction.guild.id,
                 "role_id": role.id,
-                "expires": expire_time.isoformat()
+                "expires": expire_time
             }
-            self.save_data()
+            self._record("temp_roles", temp_key)
 
             await interaction.response.send_message(
                 f"Gave {member.mention} the role {role.name} for {format_duration(role_duration)}"
@@ -547,40 +672,39 @@ class ModerationCog(commands.Cog):
         """Submit an appeal for a punishment"""
         try:
             await self.ensure_guild_initialized(interaction.guild)
-            user_id = str(interaction.user.id)
-            guild_id = str(interaction.guild.id)
-            if guild_id not in self.appeals or user_id not in self.appeals[guild_id]:
-                if user_id in self.appeals:
-                    raise ValueError("You already have a pending appeal!")
-
-                self.appeals[guild_id][user_id] = {
-                    "reason": reason,
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "status": "pending"
-                }
-                self.save_data()
-
-                # Send appeal to mod channel
-                mod_channel = discord.utils.get(
-                    interaction.guild.channels,
-                    name="mod-logs"
-                )
-                if mod_channel:
-                    embed = discord.Embed(
-                        title="New Appeal",
-                        description=f"User: {interaction.user.mention}\nReason: {reason}",
-                        color=discord.Color.blue()
-                    )
-                    message = await mod_channel.send(embed=embed)
-                    await message.add_reaction("✅")
-                    await message.add_reaction("❌")
+            user_id = interaction.user.id
+            guild_id = interaction.guild.id
+            guild_appeals = self.appeals.setdefault(guild_id, {})
+            existing = guild_appeals.get(user_id)
+            if existing and existing.get("status") == "pending":
+                raise ValueError("You already have a pending appeal!")
+
+            guild_appeals[user_id] = {
+                "reason": reason,
+                "timestamp": datetime.utcnow().isoformat(),
+                "status": "pending"
+            }
+            self._record("appeals", guild_id, user_id)
 
-                await interaction.response.send_message(
-                    "Your appeal has been submitted and will be reviewed by moderators.",
-                    ephemeral=True
+            # Send appeal to mod channel
+            mod_channel = discord.utils.get(
+                interaction.guild.channels,
+                name="mod-logs"
+            )
+            if mod_channel:
+                embed = discord.Embed(
+                    title="New Appeal",
+                    description=f"User: {interaction.user.mention}\nReason: {reason}",
+                    color=discord.Color.blue()
                 )
-            else:
-                await interaction.response.send_message("You already have a pending appeal!")
+                message = await mod_channel.send(embed=embed)
+                await message.add_reaction("✅")
+                await message.add_reaction("❌")
+
+            await interaction.response.send_message(
+                "Your appeal has been submitted and will be reviewed by moderators.",
+                ephemeral=True
+            )
         except Exception as e:
             await self.handle_command_error(interaction, e)
 
@@ -594,49 +718,76 @@ class ModerationCog(commands.Cog):
         try:
             await self.ensure_guild_initialized(interaction.guild)
             await self.check_guild_permissions(interaction, "manage_roles")
-            for channel in interaction.guild.channels:
-                if isinstance(channel, discord.TextChannel):
-                    await channel.set_permissions(member, send_messages=False)
+            await interaction.response.defer()
 
-            await interaction.response.send_message(f"Restricted {member.mention} from sending messages.")
+            channels = interaction.guild.text_channels
+            results = await asyncio.gather(
+                *(channel.set_permissions(member, send_messages=False) for channel in channels),
+                return_exceptions=True
+            )
+            failed = [
+                channel.mention for channel, result in zip(channels, results)
+                if isinstance(result, (discord.Forbidden, discord.HTTPException))
+            ]
+            for result in results:
+                if isinstance(result, Exception) and not isinstance(result, discord.HTTPException):
+                    raise result
+
+            message = f"Restricted {member.mention} from sending messages."
+            if failed:
+                message += f" Could not update {len(failed)} channel(s): {', '.join(failed[:10])}"
+            await interaction.followup.send(message)
         except Exception as e:
             await self.handle_command_error(interaction, e)
 
     @tasks.loop(minutes=1)
     async def check_temp_roles(self):
         """Check and remove expired temporary roles"""
-        current_time = datetime.utcnow()
+        current_time = time.time()
+
+        # Sweep button cooldowns that can no longer block anything
+        now = time.monotonic()
+        for key in [k for k, last_used in BUTTON_COOLDOWNS.items() if now - last_used >= BUTTON_COOLDOWN]:
+            del BUTTON_COOLDOWNS[key]
+
+        get_guild = self.bot.get_guild
+        expired = []
         for key, data in list(self.temp_roles.items()):
             try:
-                expire_time = datetime.fromisoformat(data["expires"])
-
-                if current_time >= expire_time:
-                    guild = self.bot.get_guild(data["guild_id"])
-                    if not guild:
-                        continue
-
-                    if data["action"] == "ban":
-                        try:
-                            await guild.unban(discord.Object(id=int(key)))
-                        except Exception as e:
-                            print(f"Error unbanning user: {str(e)}")
-                    elif data["action"] == "role":
-                        try:
-                            member_id, role_id = map(int, key.split("_"))
-                            member = guild.get_member(member_id)
-                            role = guild.get_role(role_id)
-
-                            if member and role:
-                                await member.remove_roles(role)
-                        except Exception as e:
-                            print(f"Error removing temporary role: {str(e)}")
-
-                    del self.temp_roles[key]
-                    self.save_data()
+                if current_time < data["expires"]:
+                    continue
+
+                guild = get_guild(data["guild_id"])
+                if not guild:
+                    continue
+
+                action = data["action"]
+                if action == "ban":
+                    try:
+                        await guild.unban(discord.Object(id=int(key)))
+                    except Exception as e:
+                        print(f"Error unbanning user: {str(e)}")
+                elif action == "role":
+                    try:
+                        member_id, role_id = map(int, key.split("_"))
+                        member = guild.get_member(member_id)
+                        role = guild.get_role(role_id)
+
+                        if member and role:
+                            await member.remove_roles(role)
+                    except Exception as e:
+                        print(f"Error removing temporary role: {str(e)}")
+
+                del self.temp_roles[key]
+                expired.append(key)
             except Exception as e:
                 print(f"Error processing temporary role {key}: {str(e)}")
                 continue
 
+        # Log every removal from this tick together once the loop is done
+        for key in expired:
+            self._record("temp_roles", key)
+
     @check_temp_roles.before_loop
     async def before_check_temp_roles(self):
         await self.bot.wait_until_ready()
@@ -665,22 +816,18 @@ class ModerationCog(commands.Cog):
             if len(reason or "") > 1000:
                 raise ValueError("Warning reason cannot exceed 1000 characters")
 
-            guild_id = str(interaction.guild.id)
-            user_id = str(member.id)
+            guild_id = interaction.guild.id
+            user_id = member.id
 
             # Add warning
-            if guild_id not in self.warnings:
-                self.warnings[guild_id] = {}
-            if user_id not in self.warnings[guild_id]:
-                self.warnings[guild_id][user_id] = []
-
-            self.warnings[guild_id][user_id].append({
+            user_warnings = self.warnings[guild_id][user_id]
+            user_warnings.append({
                 "reason": reason or "No reason provided",
                 "moderator": interaction.user.id,
                 "timestamp": datetime.utcnow().isoformat()
             })
 
-            self.save_data()
+            self._record("warnings", guild_id, user_id)
 
             # Handle violation
             try:
@@ -689,11 +836,8 @@ class ModerationCog(commands.Cog):
                 print(f"Error handling violation: {str(e)}")
 
             # Create warning embed
-            embed = discord.Embed(
-                title="⚠️ Warning Issued",
-                color=discord.Color.yellow(),
-                timestamp=datetime.utcnow()
-            )
+            embed = COMMAND_EMBED_TEMPLATES["warn"].copy()
+            embed.timestamp = datetime.utcnow()
             embed.add_field(name="Member", value=f"{member.mention} ({member.id})")
             embed.add_field(name="Moderator", value=interaction.user.mention)
             embed.add_field(
@@ -703,7 +847,7 @@ class ModerationCog(commands.Cog):
             )
             embed.add_field(
                 name="Total Warnings",
-                value=str(len(self.warnings[guild_id][user_id])),
+                value=str(len(user_warnings)),
                 inline=False
             )
 
@@ -731,25 +875,30 @@ class ModerationCog(commands.Cog):
         """View warnings for a member"""
         try:
             await self.ensure_guild_initialized(interaction.guild)
-            guild_id = str(interaction.guild.id)
-            user_id = str(member.id)
+            guild_id = interaction.guild.id
+            user_id = member.id
 
-            if (guild_id not in self.warnings or 
-                user_id not in self.warnings[guild_id] or 
-                not self.warnings[guild_id][user_id]):
+            user_warnings = self.warnings.get(guild_id, {}).get(user_id)
+            if not user_warnings:
                 await interaction.response.send_message(f"{member.mention} has no warnings.")
                 return
 
-            embed = discord.Embed(title=f"Warnings for {member.name}")
-            for i, warning in enumerate(self.warnings[guild_id][user_id], 1):
-                moderator = self.bot.get_user(warning["moderator"])
-                embed.add_field(
-                    name=f"Warning {i}",
-                    value=f"Reason: {warning['reason']}\n" \
-                          f"Moderator: {moderator.mention if moderator else 'Unknown'}\n" \
-                          f"Date: {warning['timestamp']}",
-                    inline=False
-                )
+            # Resolve each moderator once, however many warnings they issued
+            moderators = {}
+            for mod_id in {warning["moderator"] for warning in user_warnings}:
+                moderator = self.bot.get_user(mod_id)
+                moderators[mod_id] = moderator.mention if moderator else 'Unknown'
+
+            description = "\n\n".join(
+                f"**Warning {i}**\n"
+                f"Reason: {warning['reason']}\n"
+                f"Moderator: {moderators[warning['moderator']]}\n"
+                f"Date: {warning['timestamp']}"
+                for i, warning in enumerate(user_warnings, 1)
+            )
+            if len(description) > 4096:  # Discord's embed description limit
+                description = description[:4093] + "..."
+            embed = discord.Embed(title=f"Warnings for {member.name}", description=description)
 
             await interaction.response.send_message(embed=embed)
         except Exception as e:
@@ -801,12 +950,9 @@ class ModerationCog(commands.Cog):
                 raise ValueError("Failed to kick the member. Please try again")
 
             # Create and send confirmation embed
-            embed = discord.Embed(
-                title="Member Kicked",
-                description=f"Successfully kicked {member.mention}",
-                color=discord.Color.red(),
-                timestamp=datetime.utcnow()
-            )
+            embed = COMMAND_EMBED_TEMPLATES["kick"].copy()
+            embed.description = f"Successfully kicked {member.mention}"
+            embed.timestamp = datetime.utcnow()
             embed.add_field(name="Member", value=f"{member} ({member.id})")
             embed.add_field(name="Moderator", value=interaction.user.mention)
             if reason:
@@ -819,12 +965,9 @@ class ModerationCog(commands.Cog):
             try:
                 log_cog = self.bot.get_cog("LoggingCog")
                 if log_cog:
-                    log_embed = discord.Embed(
-                        title="👢 Member Kicked",
-                        description=f"{member.mention} has been kicked from the server",
-                        color=discord.Color.red(),
-                        timestamp=datetime.utcnow()
-                    )
+                    log_embed = COMMAND_EMBED_TEMPLATES["kick_log"].copy()
+                    log_embed.description = f"{member.mention} has been kicked from the server"
+                    log_embed.timestamp = embed.timestamp
                     log_embed.add_field(name="Member", value=f"{member} ({member.id})")
                     log_embed.add_field(name="Moderator", value=f"{interaction.user.mention}")
                     if reason:
@@ -859,11 +1002,8 @@ class ModerationCog(commands.Cog):
                 remaining = self._get_cooldown_remaining(interaction.user.id, "moderate")
                 raise app_commands.CommandOnCooldown(cooldown=5, retry_after=remaining)
 
-            embed = discord.Embed(
-                title=f"Moderate {member.name}",
-                description="Select a moderation action:",
-                color=discord.Color.blue()
-            )
+            embed = COMMAND_EMBED_TEMPLATES["moderate"].copy()
+            embed.title = f"Moderate {member.name}"
             embed.add_field(name="User ID", value=member.id)
             embed.add_field(name="Joined At", value=member.joined_at.strftime("%Y-%m-%d %H:%M:%S"))
             embed.set_thumbnail(url=member.display_avatar.url)
@@ -875,21 +1015,21 @@ class ModerationCog(commands.Cog):
 
     def _check_cooldown(self, user_id: int, command: str, cooldown: int = 5) -> bool:
         """Check if a command is on cooldown"""
-        key = f"{user_id}_{command}"
-        if key in self.command_cooldowns:
-            if datetime.utcnow() - self.command_cooldowns[key] < timedelta(seconds=cooldown):
-                return False
-        self.command_cooldowns[key] = datetime.utcnow()
+        key = (user_id, command)
+        now = time.monotonic()
+        last_used = self.command_cooldowns.get(key)
+        if last_used is not None and now - last_used < cooldown:
+            return False
+        self.command_cooldowns[key] = now
         return True
 
     def _get_cooldown_remaining(self, user_id: int, command: str) -> float:
         """Get remaining cooldown time in seconds"""
-        key = f"{user_id}_{command}"
-        if key in self.command_cooldowns:
-            elapsed = datetime.utcnow() - self.command_cooldowns[key]
-            remaining = timedelta(seconds=5)- elapsed
-            if remaining.total_seconds() > 0:
-                return remaining.total_seconds()
+        last_used = self.command_cooldowns.get((user_id, command))
+        if last_used is not None:
+            remaining = 5 - (time.monotonic() - last_used)
+            if remaining > 0:
+                return remaining
         return 0
 
 async def setup(bot):
@@ -1,19 +1,61 @@
 import discord
 from discord import app_commands
 from discord.ext import commands
-import json
+import msgpack
+import orjson
 import os
-from datetime import datetime, timedelta
-from typing import Dict, Optional, Union, List, Any
+import asyncio
+import bisect
+import math
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+from datetime import datetime, timezone
+from typing import Dict, Optional, Union, List, Any, Tuple
+
+REPUTATION_DIR = 'data/reputation'  # One msgpack snapshot per guild, named <guild id>.mp
+LEGACY_REPUTATION_FILE = 'data/reputation.json'  # Pre-sharding snapshot of every guild, migrated on load
+# Older JSON shards (<guild id>.json) in REPUTATION_DIR are migrated the same way
+REPUTATION_JOURNAL_FILE = 'data/reputation.log'  # Append-only JSONL of updates since the last snapshot
+JOURNAL_COMPACT_ENTRIES = 500  # Journal entries written before folding them into the snapshots
+JOURNAL_COMPACT_BYTES = 1024 * 1024  # Journal size that also triggers a snapshot
+JOURNAL_FLUSH_DELAY = 2  # Seconds updates are gathered before the journal is appended to
+HISTORY_RETENTION = 30 * 86400  # Seconds a reputation change stays in a user's history
+HISTORY_MAX_ENTRIES = 500  # Oldest history entries fall off past this many
+GIVEREP_COOLDOWN = 12 * 3600  # Seconds before the same member can rep the same target again
+REP_CACHE_MAX_ENTRIES = 4096  # (guild, user) -> live user dict shortcuts kept by get_user_rep
 
 class ReputationCog(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
         self.reputation: Dict[str, Dict[str, Dict[str, Any]]] = {}
-        self.cooldowns: Dict[str, datetime] = {}
-        self.locks: Dict[str, bool] = {}  # For preventing race conditions
-        os.makedirs('data', exist_ok=True)
+        self.cooldowns: Dict[Tuple[int, int, int], float] = {}  # (guild, giver, target) -> time.monotonic()
+        # (guild id, user id) -> lock serialising point updates; entries vanish once unused
+        self.locks: "weakref.WeakValueDictionary[Tuple[int, int], asyncio.Lock]" = weakref.WeakValueDictionary()
+        # Guild id -> (-points, user id) entries in leaderboard order, built on first /toprep
+        self._leaderboards: Dict[str, List[Tuple[int, str]]] = {}
+        # (guild id, user id) -> the user's live dict inside self.reputation, oldest first
+        self._rep_cache: Dict[Tuple[int, int], Dict[str, Any]] = {}
+        os.makedirs(REPUTATION_DIR, exist_ok=True)
+        self._dirty_guilds: set = set()  # Guild ids changed since their shard was last written
+        self._journal_entries = 0
+        self._journal_bytes = 0
+        self._journal_file = open(REPUTATION_JOURNAL_FILE, 'ab')
+        self._pending_writes: asyncio.Queue = asyncio.Queue()
+        self._save_lock = asyncio.Lock()
+        self._snapshots = 0  # Bumped by every save_data so the writer can spot stale batches
+        # All journal and snapshot file I/O runs on this one thread, in submission order
+        self._io_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rep-io")
         self.load_data()
+        self._journal_task = asyncio.create_task(self._journal_writer())
+
+    async def cog_unload(self):
+        # save_data waits for any in-flight append before snapshotting, then the writer can go
+        await self.save_data()
+        self._journal_task.cancel()
+        self._io_executor.shutdown(wait=True)
+        self._journal_file.close()
 
     async def check_permissions(self, guild: discord.Guild) -> bool:
         """Check if bot has required permissions for reputation operations"""
@@ -37,83 +79,287 @@ class ReputationCog(commands.Cog):
         return True
 
     def load_data(self):
+        """Load the per-guild snapshots and replay the journal on top of them"""
+        self.reputation = {}
+        legacy_files = []
+        # msgpack shards first, so a JSON shard left by an interrupted migration never wins
+        for filename in sorted(os.listdir(REPUTATION_DIR), key=lambda name: not name.endswith('.mp')):
+            guild_key, ext = os.path.splitext(filename)
+            if ext not in ('.mp', '.json') or not guild_key.isdigit():
+                continue
+            path = os.path.join(REPUTATION_DIR, filename)
+            if ext == '.json':
+                legacy_files.append(path)
+                if guild_key in self.reputation:
+                    continue
+            data = self._read_snapshot(path)
+            if data is None or ext == '.json':
+                self._dirty_guilds.add(guild_key)
+            self.reputation[guild_key] = data or {}
+
+        # Split the old single-file snapshot into shards; shards already written take precedence.
+        # FunCog keeps its own {'points': ..., 'history': ...} data at the same path, so only a
+        # file keyed purely by guild ids is ours to migrate and remove
+        if os.path.exists(LEGACY_REPUTATION_FILE):
+            legacy = self._read_snapshot(LEGACY_REPUTATION_FILE)
+            if legacy and all(guild_key.isdigit() for guild_key in legacy):
+                for guild_key, data in legacy.items():
+                    if guild_key not in self.reputation and isinstance(data, dict):
+                        self.reputation[guild_key] = data
+                        self._dirty_guilds.add(guild_key)
+                legacy_files.append(LEGACY_REPUTATION_FILE)
+
+        journal_damaged = False  # An unreadable line must be compacted away before appending again
         try:
-            with open('data/reputation.json', 'r') as f:
-                data = json.load(f)
-                if isinstance(data, dict):
-                    self.reputation = data
-                else:
-                    print("Warning: reputation.json contained invalid data, resetting")
-                    self.reputation = {}
-                    self.save_data()
+            with open(REPUTATION_JOURNAL_FILE, 'rb') as f:
+                for line in f:
+                    self._journal_bytes += len(line)
+                    if not line.endswith(b"\n"):
+                        journal_damaged = True
+                    try:
+                        record = orjson.loads(line)
+                        self._apply_journal(record)
+                        self._dirty_guilds.add(str(record["g"]))
+                        self._journal_entries += 1
+                    except (orjson.JSONDecodeError, KeyError, TypeError) as e:
+                        # A torn final line from a crash mid-append is expected; skip it
+                        print(f"Skipping unreadable reputation journal entry: {e}")
+                        journal_damaged = True
         except FileNotFoundError:
-            self.reputation = {}
-            self.save_data()
-        except json.JSONDecodeError:
-            print("Error: reputation.json is corrupted, creating new file")
-            self.reputation = {}
-            self.save_data()
-
-    def save_data(self):
-        """Save reputation data with atomic writes and validation"""
-        temp_file = 'data/reputation_temp.json'  
+            pass
+
+        # Older history entries only carry an ISO timestamp; add the epoch "ts" used for pruning
+        for users in self.reputation.values():
+            for user_data in users.values():
+                if not isinstance(user_data, dict):
+                    continue
+                history = user_data.get("history")
+                if not isinstance(history, deque):
+                    history = user_data["history"] = deque(
+                        history if isinstance(history, list) else (), maxlen=HISTORY_MAX_ENTRIES
+                    )
+                for h in history:
+                    if "ts" not in h:
+                        h["ts"] = self._to_epoch(h["timestamp"])
+
+        if legacy_files or journal_damaged:
+            # Startup runs before the event loop serves commands, so write in place. Truncating the
+            # journal also drops a torn tail that the next append would otherwise be glued onto
+            try:
+                self._write_snapshots(self._snapshot_payloads())
+                self._dirty_guilds.clear()
+                self._journal_entries = 0
+                self._journal_bytes = 0
+                for path in legacy_files:
+                    os.remove(path)
+            except Exception as e:
+                print(f"Error compacting reputation data on load: {e}")
+
+    @staticmethod
+    def _read_snapshot(filename: str) -> Optional[Dict[str, Any]]:
+        """Read one msgpack or legacy JSON snapshot, returning None when it is corrupted or not a dict"""
         try:
-            # Prepare data for saving
-            with open(temp_file, 'w') as f:
-                json.dump(self.reputation, f, indent=4)
+            with open(filename, 'rb') as f:
+                raw = f.read()
+            if filename.endswith('.mp'):
+                data = msgpack.unpackb(raw, raw=False)
+            else:
+                data = orjson.loads(raw)
+        except (ValueError, msgpack.UnpackException):
+            print(f"Error: {filename} is corrupted, resetting it")
+            return None
+        if not isinstance(data, dict):
+            print(f"Warning: {filename} contained invalid data, resetting it")
+            return None
+        return data
+
+    @staticmethod
+    def _to_epoch(timestamp: str) -> float:
+        """Convert a stored naive-UTC ISO timestamp to unix epoch seconds"""
+        parsed = datetime.fromisoformat(timestamp)
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return parsed.timestamp()
+
+    def _apply_journal(self, record: Dict[str, Any]):
+        """Replay one journal entry onto the in-memory reputation data"""
+        guild_data = self.reputation.setdefault(str(record["g"]), {})
+        user_key = str(record["u"])
+        user_data = guild_data.get(user_key)
+        if not isinstance(user_data, dict):
+            user_data = guild_data[user_key] = {
+                "points": 0,
+                "level": 1,
+                "last_daily": None,
+                "history": deque(maxlen=HISTORY_MAX_ENTRIES)
+            }
+        user_data["points"] = record["p"]
+        user_data["level"] = record["l"]
+        if "h" in record:
+            user_data["history"].append(record["h"])
+
+    def _journal(self, record: Dict[str, Any]):
+        """Queue one update for the journal writer and mark its guild's shard as stale"""
+        self._dirty_guilds.add(str(record["g"]))
+        self._pending_writes.put_nowait(orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE))
+
+    def _append_journal(self, lines: bytes):
+        self._journal_file.write(lines)
+        self._journal_file.flush()
+
+    async def _journal_writer(self):
+        """Append queued journal entries in batches, compacting once the journal grows too large"""
+        while True:
+            lines = [await self._pending_writes.get()]
+            snapshots = self._snapshots
+            # Let the rest of a burst (user creation, update, level-up) join this append
+            await asyncio.sleep(JOURNAL_FLUSH_DELAY)
+            async with self._save_lock:
+                if snapshots != self._snapshots:
+                    # A snapshot taken meanwhile already holds this entry and may hold newer ones
+                    lines.clear()
+                while not self._pending_writes.empty():
+                    lines.append(self._pending_writes.get_nowait())
+                if not lines:
+                    continue
+                payload = b"".join(lines)
+                try:
+                    await asyncio.get_running_loop().run_in_executor(
+                        self._io_executor, self._append_journal, payload
+                    )
+                    self._journal_entries += len(lines)
+                    self._journal_bytes += len(payload)
+                except Exception as e:
+                    print(f"Error writing reputation journal: {e}")
+            if (self._journal_entries >= JOURNAL_COMPACT_ENTRIES
+                    or self._journal_bytes >= JOURNAL_COMPACT_BYTES):
+                await self.save_data()
+
+    def _snapshot_payloads(self) -> List[Tuple[str, bytes]]:
+        """Serialise every dirty guild on the calling thread so the snapshot is consistent"""
+        return [
+            (guild_key, msgpack.packb(self.reputation.get(guild_key, {}), use_bin_type=True, default=list))
+            for guild_key in self._dirty_guilds
+        ]
 
-            # Atomic replace to prevent corruption
-            os.replace(temp_file, 'data/reputation.json')
-        except Exception as e:
-            print(f"Error saving reputation data: {e}")
-        finally:
-            # Clean up temp file in case of errors
-            if os.path.exists(temp_file):
+    def _write_snapshots(self, payloads: List[Tuple[str, bytes]]):
+        """Atomically replace each dirty guild's shard, then truncate the journal"""
+        for guild_key, payload in payloads:
+            filename = os.path.join(REPUTATION_DIR, f"{guild_key}.mp")
+            temp_file = filename + '.tmp'
+            try:
+                with open(temp_file, 'wb') as f:
+                    f.write(payload)
+
+                # Atomic replace to prevent corruption
+                os.replace(temp_file, filename)
+            except Exception:
+                # Only a failed write or replace can leave the temp file behind
                 try:
                     os.remove(temp_file)
-                except Exception as e:
-                    print(f"Error cleaning up temp file: {e}")
+                except OSError:
+                    pass
+                raise
+
+        # Everything journalled so far is now part of the shards
+        self._journal_file.seek(0)
+        self._journal_file.truncate()
+
+    async def save_data(self):
+        """Fold the journal into fresh shards for the guilds it touched without blocking the event loop"""
+        async with self._save_lock:
+            # Serialise on the event loop so the snapshot is consistent with in-memory state
+            payloads = self._snapshot_payloads()
+            self._dirty_guilds = set()
+            self._snapshots += 1
+            # Everything still queued is already reflected in the snapshot
+            while not self._pending_writes.empty():
+                self._pending_writes.get_nowait()
+            try:
+                await asyncio.get_running_loop().run_in_executor(
+                    self._io_executor, self._write_snapshots, payloads
+                )
+                self._journal_entries = 0
+                self._journal_bytes = 0
+            except Exception as e:
+                # Keep the journal and retry these guilds on the next compaction
+                self._dirty_guilds.update(guild_key for guild_key, _ in payloads)
+                print(f"Error saving reputation data: {e}")
 
     def get_user_rep(self, guild_id: int, user_id: int) -> Dict:
         """Get or create user reputation data with validation"""
+        cached = self._rep_cache.get((guild_id, user_id))
+        if cached is not None:
+            return cached
+
         guild_key = str(guild_id)
         user_key = str(user_id)
 
         try:
-            if guild_key not in self.reputation:
-                self.reputation[guild_key] = {}
+            guild_data = self.reputation.get(guild_key)
+            if guild_data is None:
+                guild_data = self.reputation[guild_key] = {}
 
-            if user_key not in self.reputation[guild_key]:
-                self.reputation[guild_key][user_key] = {
+            user_data = guild_data.get(user_key)
+            if user_data is None:
+                user_data = guild_data[user_key] = {
                     "points": 0,
                     "level": 1,
                     "last_daily": None,
-                    "history": []
+                    "history": deque(maxlen=HISTORY_MAX_ENTRIES)
                 }
-                self.save_data()
-
+                # A fresh record is identical to a missing one on replay, so only its first update is journalled
+                board = self._leaderboards.get(guild_key)
+                if board is not None:
+                    bisect.insort(board, (0, user_key))
             # Validate data structure
-            user_data = self.reputation[guild_key][user_key]
-            if not isinstance(user_data, dict):
+            elif not isinstance(user_data, dict):
                 print(f"Invalid user data structure for {user_key} in guild {guild_key}, resetting")
-                self.reputation[guild_key][user_key] = {
+                user_data = guild_data[user_key] = {
                     "points": 0,
                     "level": 1,
                     "last_daily": None,
-                    "history": []
+                    "history": deque(maxlen=HISTORY_MAX_ENTRIES)
                 }
-                self.save_data()
-
-            return self.reputation[guild_key][user_key]
+                self._journal({"g": guild_id, "u": user_id, "p": 0, "l": 1})
+                # The broken entry's old position is unknown, so rebuild on the next /toprep
+                self._leaderboards.pop(guild_key, None)
+
+            if len(self._rep_cache) >= REP_CACHE_MAX_ENTRIES:
+                del self._rep_cache[next(iter(self._rep_cache))]
+            self._rep_cache[(guild_id, user_id)] = user_data
+            return user_data
         except Exception as e:
             print(f"Error in get_user_rep: {e}")
             return {
                 "points": 0,
                 "level": 1,
                 "last_daily": None,
-                "history": []
+                "history": deque(maxlen=HISTORY_MAX_ENTRIES)
             }
 
+    def _get_leaderboard(self, guild_key: str) -> List[Tuple[int, str]]:
+        """Get the guild's sorted leaderboard, building it from the stored points if needed"""
+        board = self._leaderboards.get(guild_key)
+        if board is None:
+            board = self._leaderboards[guild_key] = sorted(
+                (-data["points"], user_key)
+                for user_key, data in self.reputation.get(guild_key, {}).items()
+                if isinstance(data, dict)
+            )
+        return board
+
+    def _move_on_leaderboard(self, guild_key: str, user_key: str, old_points: int, new_points: int):
+        """Reposition a user on an already-built leaderboard after their points change"""
+        board = self._leaderboards.get(guild_key)
+        if board is None or old_points == new_points:
+            return
+        entry = (-old_points, user_key)
+        index = bisect.bisect_left(board, entry)
+        if index < len(board) and board[index] == entry:
+            del board[index]
+        bisect.insort(board, (-new_points, user_key))
+
     async def initialize_guild(self, guild: discord.Guild):
         """Initialize reputation data for a new guild with validation"""
         try:
@@ -125,8 +371,8 @@ class ReputationCog(commands.Cog):
 
             guild_id = str(guild.id)
             if guild_id not in self.reputation:
+                # An empty guild needs no journal entry; its first user update recreates it on replay
                 self.reputation[guild_id] = {}
-                self.save_data()
                 print(f"Initialized reputation system for guild: {guild.name} ({guild_id})")
             return True
         except Exception as e:
@@ -134,56 +380,56 @@ class ReputationCog(commands.Cog):
             return False
 
     def calculate_level(self, points: int) -> int:
-        """Calculate level based on points with validation"""
-        try:
-            return max(1, int((points / 100) ** 0.5) + 1)
-        except Exception as e:
-            print(f"Error calculating level for {points} points: {e}")
-            return 1
-
-    async def update_points(self, guild_id: int, user_id: int, points: int, reason: str):
-        """Update user's reputation points with improved error handling and race condition prevention"""
-        lock_key = f"{guild_id}_{user_id}"
-        if self.locks.get(lock_key):
-            raise ValueError("Another reputation update is in progress")
-
-        try:
-            self.locks[lock_key] = True
-            data = self.get_user_rep(guild_id, user_id)
-            previous_points = data["points"]
-            data["points"] = max(0, data["points"] + points)
-            new_level = self.calculate_level(data["points"])
-
-            # Validate history structure
-            if not isinstance(data.get("history", []), list):
-                data["history"] = []
-
-            data["history"].append({
-                "change": points,
-                "previous_points": previous_points,
-                "new_points": data["points"],
-                "reason": reason,
-                "timestamp": datetime.utcnow().isoformat()
-            })
-
-            # Keep only last 30 days of history
-            cutoff = datetime.utcnow() - timedelta(days=30)
-            data["history"] = [
-                h for h in data["history"]
-                if datetime.fromisoformat(h["timestamp"]) > cutoff
-            ]
-
-            # Level up notification
-            level_changed = new_level != data["level"]
-            data["level"] = new_level
-
-            self.save_data()
-            return level_changed
-        except Exception as e:
-            print(f"Error updating points for user {user_id} in guild {guild_id}: {e}")
-            return False
-        finally:
-            self.locks[lock_key] = False
+        """Calculate level based on points"""
+        # Level n starts at (n - 1)^2 * 100 points; isqrt keeps this exact integer maths
+        return math.isqrt(max(0, points) // 100) + 1
+
+    async def update_points(self, guild_id: int, user_id: int, points: int, reason: str) -> Tuple[bool, Optional[int]]:
+        """Update user's reputation points, returning whether the level changed and the new level"""
+        lock_key = (guild_id, user_id)
+        lock = self.locks.get(lock_key)
+        if lock is None:
+            lock = self.locks[lock_key] = asyncio.Lock()
+
+        async with lock:
+            try:
+                data = self.get_user_rep(guild_id, user_id)
+                previous_points = data["points"]
+                data["points"] = max(0, data["points"] + points)
+                new_level = self.calculate_level(data["points"])
+
+                # Validate history structure
+                if not isinstance(data.get("history"), deque):
+                    data["history"] = deque(maxlen=HISTORY_MAX_ENTRIES)
+
+                # One clock read so the ISO timestamp and the epoch "ts" always agree
+                now = datetime.now(timezone.utc)
+                data["history"].append({
+                    "change": points,
+                    "previous_points": previous_points,
+                    "new_points": data["points"],
+                    "reason": reason,
+                    "timestamp": now.replace(tzinfo=None).isoformat(),
+                    "ts": now.timestamp()
+                })
+
+                self._move_on_leaderboard(str(guild_id), str(user_id), previous_points, data["points"])
+
+                # Level up notification
+                level_changed = new_level != data["level"]
+                data["level"] = new_level
+
+                self._journal({
+                    "g": guild_id,
+                    "u": user_id,
+                    "p": data["points"],
+                    "l": data["level"],
+                    "h": data["history"][-1]
+                })
+                return level_changed, new_level
+            except Exception as e:
+                print(f"Error updating points for user {user_id} in guild {guild_id}: {e}")
+                return False, None
 
     @app_commands.command(name="rep", description="View reputation points and level for yourself or another member")
     @app_commands.describe(
@@ -234,17 +480,17 @@ class ReputationCog(commands.Cog):
                 inline=False
             )
 
-            # Recent history
-            recent_history = sorted(
-                data["history"],
-                key=lambda x: datetime.fromisoformat(x["timestamp"]),
-                reverse=True
-            )[:5]
+            # History is appended in time order, so drop expired entries from the left
+            history = data["history"]
+            cutoff = time.time() - HISTORY_RETENTION
+            while history and history[0]["ts"] <= cutoff:
+                history.popleft()
+            recent_history = [history[-i] for i in range(1, min(5, len(history)) + 1)]
 
             if recent_history:
                 history_text = "\n".join(
                     f"{h['change']:+d} points - {h['reason']} "
-                    f"(<t:{int(datetime.fromisoformat(h['timestamp']).timestamp())}:R>)"
+                    f"(<t:{int(h['ts'])}:R>)"
                     for h in recent_history
                 )
                 embed.add_field(
@@ -285,19 +531,20 @@ class ReputationCog(commands.Cog):
                 raise ValueError("Please provide a valid reason (at least 3 characters)")
 
             # Check cooldown with guild-specific tracking
-            cooldown_key = f"{interaction.guild.id}_{interaction.user.id}_{member.id}"
-            if cooldown_key in self.cooldowns:
-                remaining = timedelta(hours=12) - (datetime.utcnow() - self.cooldowns[cooldown_key])
-                if remaining.total_seconds() > 0:
+            cooldown_key = (interaction.guild.id, interaction.user.id, member.id)
+            last_given = self.cooldowns.get(cooldown_key)
+            if last_given is not None:
+                remaining = GIVEREP_COOLDOWN - (time.monotonic() - last_given)
+                if remaining > 0:
                     raise ValueError(
-                        f"You can give reputation to this user again in {int(remaining.total_seconds() / 60)} minutes"
+                        f"You can give reputation to this user again in {int(remaining / 60)} minutes"
                     )
 
             if not await self.initialize_guild(interaction.guild):
                 raise ValueError("Failed to initialize reputation system")
 
-            self.cooldowns[cooldown_key] = datetime.utcnow()
-            level_up = await self.update_points(
+            self.cooldowns[cooldown_key] = time.monotonic()
+            level_up, new_level = await self.update_points(
                 interaction.guild.id,
                 member.id,
                 10,  # Base reputation gain
@@ -309,10 +556,9 @@ class ReputationCog(commands.Cog):
             )
 
             if level_up:
-                data = self.get_user_rep(interaction.guild.id, member.id)
                 await interaction.channel.send(
                     f"🎉 Congratulations {member.mention}! "
-                    f"You've reached reputation level {data['level']}!"
+                    f"You've reached reputation level {new_level}!"
                 )
         except Exception as e:
             error_msg = str(e) if isinstance(e, (ValueError, discord.Forbidden)) else "An error occurred while giving reputation"
@@ -335,20 +581,24 @@ class ReputationCog(commands.Cog):
                 raise ValueError("Failed to initialize reputation system")
 
             guild_id = str(interaction.guild.id)
-            if guild_id not in self.reputation:
+            guild_data = self.reputation.get(guild_id)
+            if guild_data is None:
                 await interaction.response.send_message(
                     "No reputation data for this server yet!",
                     ephemeral=True
                 )
                 return
 
-            # Sort users by points
+            # Walk the sorted leaderboard until ten members are found
             leaderboard = []
-            for user_id, data in self.reputation[guild_id].items():
+            for _, user_id in self._get_leaderboard(guild_id):
                 try:
                     member = interaction.guild.get_member(int(user_id))
                     if member and not member.bot:  # Only include non-bot users still in the server
+                        data = guild_data[user_id]
                         leaderboard.append((member, data["points"], data["level"]))
+                        if len(leaderboard) == 10:
+                            break
                 except ValueError:
                     continue  # Skip invalid user IDs
 
@@ -359,15 +609,13 @@ class ReputationCog(commands.Cog):
                 )
                 return
 
-            leaderboard.sort(key=lambda x: x[1], reverse=True)
-
             embed = discord.Embed(
                 title="🏆 Reputation Leaderboard",
                 color=discord.Color.gold()
             )
 
             # Show top 10
-            for i, (member, points, level) in enumerate(leaderboard[:10], 1):
+            for i, (member, points, level) in enumerate(leaderboard, 1):
                 embed.add_field(
                     name=f"{i}. {member.display_name}",
                     value=f"Level {level} ({points} points)",
@@ -1,54 +1,80 @@
 import discord
 from discord import app_commands
-from discord.ext import commands
+from discord.ext import commands, tasks
 import asyncio
 from datetime import datetime
-import json
+import orjson
 import os
-from typing import Dict, List, Optional, Set, Any
+import time
+import weakref
+from typing import Dict, List, Optional, Set, Any, Tuple
+
+TICKET_COOLDOWN = 300.0  # Seconds a user waits between tickets
+RATE_LIMIT_MAX_ENTRIES = 4096  # Rate limit entries kept before expired ones are swept
 
 class TicketsCog(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.ticket_messages: Dict[str, List[int]] = {}  # guild_id -> list of message IDs
+        self.ticket_messages: Dict[str, Set[int]] = {}  # guild_id -> set of panel message IDs
         self.active_tickets: Dict[str, Dict[str, datetime]] = {}  # guild_id -> {user_id: creation_time}
-        self.locks: Dict[str, asyncio.Lock] = {}
-        self.rate_limits: Dict[str, datetime] = {}  # user_id -> last_ticket_time
+        # Key tuple -> lock; entries vanish once no coroutine holds or waits on them
+        self.locks: "weakref.WeakValueDictionary[Tuple, asyncio.Lock]" = weakref.WeakValueDictionary()
+        self.rate_limits: Dict[str, float] = {}  # user_id -> time.monotonic() of last ticket
+        self._dirty = False  # Set by ticket mutations, written out by flush_data
         os.makedirs('data', exist_ok=True)
         self.load_data()
-
-    async def get_lock(self, key: str) -> asyncio.Lock:
+        self.flush_data.start()
+
+    async def cog_unload(self):
+        self.flush_data.cancel()
+        if self._dirty:
+            self._dirty = False
+            await self.save_data()
+
+    @tasks.loop(seconds=2)
+    async def flush_data(self):
+        """Write pending ticket changes in one batch"""
+        if self._dirty:
+            self._dirty = False
+            await self.save_data()
+
+    def get_lock(self, key: Tuple) -> asyncio.Lock:
         """Get or create a lock for a specific key"""
-        if key not in self.locks:
-            self.locks[key] = asyncio.Lock()
-        return self.locks[key]
+        lock = self.locks.get(key)
+        if lock is None:
+            lock = self.locks[key] = asyncio.Lock()
+        return lock
 
     async def can_create_ticket(self, user_id: str) -> bool:
         """Check if a user can create a new ticket (rate limiting)"""
-        now = datetime.utcnow()
-        if user_id in self.rate_limits:
-            if (now - self.rate_limits[user_id]).total_seconds() < 300:  # 5 minutes cooldown
-                return False
+        now = time.monotonic()
+        last_ticket = self.rate_limits.get(user_id)
+        if last_ticket is not None and now - last_ticket < TICKET_COOLDOWN:
+            return False
         self.rate_limits[user_id] = now
+        if len(self.rate_limits) > RATE_LIMIT_MAX_ENTRIES:
+            self.rate_limits = {
+                k: v for k, v in self.rate_limits.items() if now - v < TICKET_COOLDOWN
+            }
         return True
 
     def load_data(self):
         """Load ticket data with enhanced error handling and validation"""
         try:
             # Load ticket messages
-            with open('data/tickets.json', 'r') as f:
-                data = json.load(f)
+            with open('data/tickets.json', 'rb') as f:
+                data = orjson.loads(f.read())
                 if not isinstance(data, dict):
                     raise ValueError("Invalid ticket data format")
                 self.ticket_messages = {
-                    str(guild_id): [int(msg_id) for msg_id in msg_ids]
+                    str(guild_id): {int(msg_id) for msg_id in msg_ids}
                     for guild_id, msg_ids in data.items()
                 }
 
         except FileNotFoundError:
             print("No existing ticket data found, creating new file")
             self.ticket_messages = {}
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             print("Error: tickets.json is corrupted, creating backup")
             self._backup_corrupted_file('data/tickets.json')
             self.ticket_messages = {}
@@ -58,8 +84,8 @@ class TicketsCog(commands.Cog):
 
         # Load active tickets data
         try:
-            with open('data/active_tickets.json', 'r') as f:
-                data = json.load(f)
+            with open('data/active_tickets.json', 'rb') as f:
+                data = orjson.loads(f.read())
                 if not isinstance(data, dict):
                     raise ValueError("Invalid active tickets data format")
                 self.active_tickets = {
@@ -71,7 +97,7 @@ class TicketsCog(commands.Cog):
                 }
         except FileNotFoundError:
             self.active_tickets = {}
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             print("Error: active_tickets.json is corrupted, creating backup")
             self._backup_corrupted_file('data/active_tickets.json')
             self.active_tickets = {}
@@ -79,7 +105,7 @@ class TicketsCog(commands.Cog):
             print(f"Error loading active tickets: {e}")
             self.active_tickets = {}
 
-        self.save_data()
+        self._save_sync()
 
     def _backup_corrupted_file(self, filepath: str):
         """Create a backup of a corrupted file"""
@@ -91,27 +117,19 @@ class TicketsCog(commands.Cog):
         except Exception as e:
             print(f"Error creating backup: {e}")
 
-    def save_data(self):
+    def _save_sync(self):
         """Save ticket data with atomic writes"""
         try:
             # Save ticket messages
             temp_file = 'data/tickets_temp.json'
-            with open(temp_file, 'w') as f:
-                json.dump(self.ticket_messages, f, indent=4)
+            with open(temp_file, 'wb') as f:
+                f.write(orjson.dumps(self.ticket_messages, default=list))
             os.replace(temp_file, 'data/tickets.json')
 
-            # Save active tickets
-            active_tickets_data = {
-                guild_id: {
-                    user_id: timestamp.isoformat()
-                    for user_id, timestamp in tickets.items()
-                }
-                for guild_id, tickets in self.active_tickets.items()
-            }
-
+            # Save active tickets; orjson writes the naive datetimes as ISO strings itself
             temp_file = 'data/active_tickets_temp.json'
-            with open(temp_file, 'w') as f:
-                json.dump(active_tickets_data, f, indent=4)
+            with open(temp_file, 'wb') as f:
+                f.write(orjson.dumps(self.active_tickets))
             os.replace(temp_file, 'data/active_tickets.json')
 
         except Exception as e:
@@ -122,6 +140,17 @@ class TicketsCog(commands.Cog):
                 except:
                     pass
 
+    async def save_data(self):
+        await asyncio.to_thread(self._save_sync)
+
+    @staticmethod
+    def _write_transcript(filename: str, text: str):
+        """Save a transcript atomically via a temp file and os.replace"""
+        temp_filename = f"{filename}.tmp"
+        with open(temp_filename, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(temp_filename, filename)
+
     async def check_permissions(self, guild: discord.Guild) -> bool:
         """Check if bot has required permissions for ticket operations"""
         if not guild or not guild.me:
@@ -198,22 +227,20 @@ class TicketsCog(commands.Cog):
             if support_role:
                 overwrites[support_role] = discord.PermissionOverwrite(read_messages=True, send_messages=True)
 
-            # Create the channel
-            async with await self.get_lock(f"ticket_{guild_id}_{user_id}"):
-                channel = await category.create_text_channel(
-                    name=channel_name,
-                    overwrites=overwrites,
-                    topic=f"Support ticket for {user.name} | Created: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')}"
-                )
+            # No lock around the API call: can_create_ticket already stamped this user, so a
+            # concurrent attempt from them is rejected, and other users never contend here
+            channel = await category.create_text_channel(
+                name=channel_name,
+                overwrites=overwrites,
+                topic=f"Support ticket for {user.name} | Created: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')}"
+            )
 
-                # Update active tickets
-                if guild_id not in self.active_tickets:
-                    self.active_tickets[guild_id] = {}
-                self.active_tickets[guild_id][user_id] = datetime.utcnow()
-                self.save_data()
+            # Update active tickets; nothing is awaited here, so the update is atomic on the loop
+            self.active_tickets.setdefault(guild_id, {})[user_id] = datetime.utcnow()
+            self._dirty = True
 
-                print(f"Created ticket channel {channel.name} in guild {guild.name}")
-                return channel
+            print(f"Created ticket channel {channel.name} in guild {guild.name}")
+            return channel
 
         except discord.Forbidden:
             print(f"Failed to create ticket channel in guild {guild.name}: Missing permissions")
@@ -228,28 +255,28 @@ class TicketsCog(commands.Cog):
     async def on_raw_reaction_add(self, payload: discord.RawReactionActionEvent):
         """Handle ticket creation from reactions with enhanced error handling"""
         try:
-            # Basic validation
-            if payload.user_id == self.bot.user.id:
+            # Only reactions on a ticket panel matter; everything else returns before any lookups
+            panels = self.ticket_messages.get(str(payload.guild_id))
+            if not panels or payload.message_id not in panels:
                 return
 
-            guild_id = str(payload.guild_id)
-            if guild_id not in self.ticket_messages or payload.message_id not in self.ticket_messages[guild_id]:
+            if payload.user_id == self.bot.user.id:
                 return
 
             guild = self.bot.get_guild(payload.guild_id)
             if not guild:
                 return
 
-            user = await self.bot.fetch_user(payload.user_id)
+            # Prefer cached objects; only fall back to the API on a cache miss
+            user = payload.member or guild.get_member(payload.user_id) or await self.bot.fetch_user(payload.user_id)
             if user.bot:
                 return
 
-            channel = await self.bot.fetch_channel(payload.channel_id)
+            channel = guild.get_channel(payload.channel_id) or await self.bot.fetch_channel(payload.channel_id)
             if not channel:
                 return
 
-            message = await channel.fetch_message(payload.message_id)
-            await message.remove_reaction(payload.emoji, user)
+            await channel.get_partial_message(payload.message_id).remove_reaction(payload.emoji, user)
 
             try:
                 ticket_channel = await self.create_ticket_channel(guild, user)
@@ -306,7 +333,8 @@ class TicketsCog(commands.Cog):
                 try:
                     # Verify if old panels are still valid
                     valid_messages = []
-                    for msg_id in self.ticket_messages[guild_id]:
+                    # Snapshot the ids: reactions and other panels can change the set while fetch_message awaits
+                    for msg_id in list(self.ticket_messages[guild_id]):
                         try:
                             channel = interaction.channel
                             await channel.fetch_message(msg_id)
@@ -336,10 +364,8 @@ class TicketsCog(commands.Cog):
                 msg = await interaction.channel.send(embed=embed)
                 await msg.add_reaction("📩")
 
-                if guild_id not in self.ticket_messages:
-                    self.ticket_messages[guild_id] = []
-                self.ticket_messages[guild_id].append(msg.id)
-                self.save_data()
+                self.ticket_messages.setdefault(guild_id, set()).add(msg.id)
+                self._dirty = True
 
                 await interaction.response.send_message("Ticket panel created!", ephemeral=True)
             except discord.Forbidden:
@@ -387,41 +413,39 @@ class TicketsCog(commands.Cog):
             try:
                 # Generate transcript
                 transcript = []
-                async with await self.get_lock(f"transcript_{interaction.channel.id}"):
-                    async for message in interaction.channel.history(limit=100):
-                        # Format attachments
-                        attachments = ''
-                        if message.attachments:
-                            attachments = f" [Attachments: {', '.join([a.filename for a in message.attachments])}]"
-
-                        # Format embeds
-                        embeds = ''
-                        if message.embeds:
-                            embeds = ' [Embedded content]'
-
-                        transcript.append(
-                            f"[{message.created_at.strftime('%Y-%m-%d %H:%M:%S')}] "
-                            f"{message.author.name}: {message.content}{attachments}{embeds}"
-                        )
+                async for message in interaction.channel.history(limit=100):
+                    # Format attachments
+                    attachments = ''
+                    if message.attachments:
+                        attachments = f" [Attachments: {', '.join(a.filename for a in message.attachments)}]"
+
+                    # Format embeds
+                    embeds = ''
+                    if message.embeds:
+                        embeds = ' [Embedded content]'
+
+                    transcript.append(
+                        f"[{message.created_at.strftime('%Y-%m-%d %H:%M:%S')}] "
+                        f"{message.author.name}: {message.content}{attachments}{embeds}"
+                    )
 
-                transcript_text = "\n".join(reversed(transcript))
+                header = [
+                    f"Ticket Transcript - {interaction.guild.name}",
+                    f"Channel: {interaction.channel.name}",
+                    f"Closed by: {interaction.user.name}",
+                ]
+                if reason:
+                    header.append(f"Reason: {reason}")
+                header.append(f"Date: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')}\n\n")
+                # History arrives newest first; the transcript reads oldest first
+                transcript.reverse()
+                transcript_text = "\n".join(header) + "\n".join(transcript)
                 transcript_filename = f"transcript-{interaction.channel.name}.txt"
 
-                # Save transcript atomically
-                temp_filename = f"{transcript_filename}.tmp"
-                with open(temp_filename, "w", encoding="utf-8") as f:
-                    f.write(f"Ticket Transcript - {interaction.guild.name}\n")
-                    f.write(f"Channel: {interaction.channel.name}\n")
-                    f.write(f"Closed by: {interaction.user.name}\n")
-                    if reason:
-                        f.write(f"Reason: {reason}\n")
-                    f.write(f"Date: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')}\n\n")
-                    f.write(transcript_text)
-
-                os.replace(temp_filename, transcript_filename)
+                await asyncio.to_thread(self._write_transcript, transcript_filename, transcript_text)
 
                 # Clean up active tickets
-                async with await self.get_lock(f"guild_{interaction.guild.id}"):
+                async with self.get_lock(("guild", interaction.guild.id)):
                     channel_name = interaction.channel.name.lower()
                     if channel_name.startswith('ticket-'):
                         username = channel_name[7:]  # Remove 'ticket-' prefix
@@ -433,7 +457,7 @@ class TicketsCog(commands.Cog):
                                 if user and user.name.lower() == username:
                                     del self.active_tickets[guild_id][user_id]
                                     break
-                            self.save_data()
+                            self._dirty = True
 
                 # Send transcript and close
                 await interaction.response.send_message(
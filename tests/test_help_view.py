@@ -0,0 +1,75 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+discord = pytest.importorskip("discord")
+
+from cogs.help import CategoryRecord, HelpView
+
+
+class FakeResponse:
+    def __init__(self):
+        self.deferred = False
+        self.edited = False
+
+    def is_done(self):
+        return self.deferred or self.edited
+
+    async def defer(self):
+        self.deferred = True
+
+    async def edit_message(self, **kwargs):
+        self.edited = True
+
+
+class FakeHelpCog:
+    def __init__(self, names):
+        self.category_records = [
+            CategoryRecord(name, "", "", "", (), 0, name, discord.ButtonStyle.secondary)
+            for name in names
+        ]
+
+    def get_categories(self):
+        return tuple(record.name for record in self.category_records)
+
+    async def can_access_category(self, user, category, guild, member=None):
+        return True
+
+    def is_embed_cached(self, guild_id, category):
+        return True
+
+    def get_categories_page(self, guild):
+        return discord.Embed(title="Overview")
+
+    def get_commands_page(self, category, guild):
+        return discord.Embed(title=category)
+
+
+def make_interaction(user):
+    guild = SimpleNamespace(id=1, get_member=lambda user_id: None)
+    return SimpleNamespace(guild=guild, user=user, response=FakeResponse())
+
+
+def test_category_after_paging_back_is_redrawn(monkeypatch):
+    async def allow(self, user_id):
+        return True
+
+    monkeypatch.setattr(HelpView, "check_rate_limit", allow)
+
+    async def scenario():
+        user = SimpleNamespace(id=42)
+        view = HelpView(FakeHelpCog(["General", "Fun", "Utility", "Moderation", "Music"]), user)
+        general = view.create_category_callback("General")
+
+        await general(make_interaction(user))
+        await view.next_page_callback(make_interaction(user))
+        await view.prev_page_callback(make_interaction(user))
+        assert view._last_state == (None, 0)
+
+        interaction = make_interaction(user)
+        await general(interaction)
+        assert interaction.response.edited
+        assert view._last_state == ("General", 0)
+
+    asyncio.run(scenario())
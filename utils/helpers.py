@@ -1,8 +1,13 @@
 from datetime import datetime, timedelta
+from functools import lru_cache
 import re
 
+@lru_cache(maxsize=128)
 def parse_time(time_str: str) -> timedelta:
-    """Convert time string (e.g., '1d', '30m', '12h') to timedelta"""
+    """Convert time string (e.g., '1d', '30m', '12h') to timedelta
+
+    Cached since moderators reuse a handful of durations; timedelta is immutable so sharing is safe.
+    """
     units = {
         's': 'seconds',
         'm': 'minutes',